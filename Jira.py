@@ -1,8 +1,52 @@
-import requests
-import json
-from typing import Dict, List, Optional, Any
-from datetime import datetime
 import base64
+import contextlib
+import copy
+import importlib
+from typing import Dict, List, Optional, Any
+
+
+# מודולים כבדים נטענים רק בשימוש הראשון - כך ש-`import Jira` נשאר מהיר
+# עבור hooks קצרים (git hooks וכו'). מפתח = שם התכונה במודול, ערך = (מודול, שם בתוכו או None)
+_LAZY_ATTRIBUTES = {
+    'requests': ('requests', None),
+    'json': ('json', None),
+    'get_codec': ('jira_codec', 'get_codec'),
+    'JqlWatcher': ('jira_watcher', 'JqlWatcher'),
+    'RequestScheduler': ('jira_scheduler', 'RequestScheduler'),
+    'UserDirectory': ('jira_users', 'UserDirectory'),
+    'text_to_adf': ('jira_adf', 'text_to_adf'),
+    'markdown_to_adf': ('jira_adf', 'markdown_to_adf'),
+    'adf_template': ('jira_adf', 'template'),
+}
+
+
+def _lazy(name: str) -> Any:
+    """
+    טעינת תכונה עצלה ושמירתה במודול כך שהטעינה מתבצעת פעם אחת בלבד
+    
+    Args:
+        name (str): שם התכונה מתוך _LAZY_ATTRIBUTES
+        
+    Returns:
+        Any: המודול או התכונה שנטענו
+    """
+    value = globals().get(name)
+    if value is None:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        value = importlib.import_module(module_name)
+        if attribute is not None:
+            value = getattr(value, attribute)
+        globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    """
+    גישה עצלה מבחוץ (למשל Jira.requests) - PEP 562
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _lazy(name)
 
 
 class JiraIssueManager:
@@ -10,7 +54,8 @@ class JiraIssueManager:
     מחלקה לניהול Issues בג'ירה - יצירה, עדכון, מחיקה וחיפוש
     """
     
-    def __init__(self, base_url: str, username: str, token: str):
+    def __init__(self, base_url: str, username: str, token: str, codec: Any = None,
+                 scheduler: Any = None):
         """
         אתחול החיבור לג'ירה
         
@@ -18,6 +63,8 @@ class JiraIssueManager:
             base_url (str): כתובת הבסיס של ג'ירה (למשל: https://your-domain.atlassian.net)
             username (str): שם המשתמש או כתובת האימייל
             token (str): API Token מג'ירה
+            codec (Any): קודק JSON או שם קודק (orjson, msgspec, ujson, json) - ברירת מחדל: זיהוי אוטומטי
+            scheduler (RequestScheduler): מתזמן בקשות לפי עדיפות (אופציונלי) - ראה jira_scheduler.py
         """
         self.base_url = base_url.rstrip('/')
         self.username = username
@@ -34,6 +81,141 @@ class JiraIssueManager:
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
+        
+        # ה-Session של requests והקודק נוצרים רק בשימוש הראשון
+        self._session = None
+        self._codec = codec
+        self.scheduler = scheduler
+        # עדיפות קבועה לכל הבקשות של המופע (ראה with_priority) - None = לפי ההקשר
+        self.request_priority = None
+        
+        # אינדקס משתמשים מקומי (UserDirectory) לתרגום assignee ל-accountId - אופציונלי
+        self.user_directory = None
+    
+    @property
+    def session(self):
+        """
+        Session משותף לכל הבקשות (שימוש חוזר בחיבורים) - נוצר בשימוש הראשון
+        """
+        if self._session is None:
+            requests = _lazy('requests')
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+            if self.scheduler is not None:
+                # מאגר החיבורים בגודל המקביליות שהמתזמן מאפשר
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=self.scheduler.max_concurrency,
+                    pool_maxsize=self.scheduler.max_concurrency
+                )
+                self._session.mount('https://', adapter)
+                self._session.mount('http://', adapter)
+        return self._session
+    
+    def priority(self, name: str):
+        """
+        קביעת מחלקת עדיפות (interactive / batch) לכל הבקשות בבלוק
+        
+        העדיפות נשמרת ב-contextvar, ש-threads של ThreadPoolExecutor לא יורשים -
+        לעבודה מרובת threads יש להשתמש ב-with_priority (או להריץ את ה-worker דרך
+        contextvars.copy_context().run).
+        
+        Args:
+            name (str): שם מחלקת העדיפות
+            
+        Returns:
+            context manager - ללא השפעה אם לא הוגדר scheduler
+        """
+        if self.scheduler is None:
+            return contextlib.nullcontext()
+        return self.scheduler.priority(name)
+    
+    def with_priority(self, name: str) -> 'JiraIssueManager':
+        """
+        עותק של המנהל שכל הבקשות שלו נשלחות במחלקת העדיפות name
+        
+        בניגוד ל-priority(), העדיפות שמורה במופע ולא בהקשר הנוכחי - ולכן חלה גם
+        בתוך threads של ThreadPoolExecutor, שלא יורשים את ההקשר. העותק משתף עם
+        המקור את ה-Session, הקודק, המתזמן ו-user_directory.
+        
+        דוגמה:
+            batch = jira.with_priority(BATCH)
+            executor.map(lambda key: batch.update_issue(key, fields), keys)
+        
+        Args:
+            name (str): שם מחלקת העדיפות
+            
+        Returns:
+            JiraIssueManager: העותק
+        """
+        if self.scheduler is not None and name not in self.scheduler.weights:
+            raise ValueError(f"עדיפות לא מוכרת: {name} (זמינות: {', '.join(self.scheduler.weights)})")
+        # יצירה מראש כדי שהעותק ישתמש באותו Session ובאותו קודק
+        self.session
+        self.codec
+        view = copy.copy(self)
+        view.request_priority = name
+        return view
+    
+    @property
+    def codec(self):
+        """
+        קודק ה-JSON של הבקשות והתגובות - נבחר בשימוש הראשון
+        """
+        if self._codec is None or isinstance(self._codec, str):
+            self._codec = _lazy('get_codec')(self._codec)
+        return self._codec
+    
+    def _request(self, method: str, url: str, payload: Any = None, priority: str = None, **kwargs):
+        """
+        שליחת בקשת HTTP דרך ה-Session (ודרך המתזמן, אם הוגדר)
+        
+        Args:
+            method (str): שיטת HTTP (GET, POST, PUT, DELETE)
+            url (str): כתובת מלאה
+            payload (Any): גוף הבקשה - יומר ל-JSON (bytes נשלחים כמו שהם) (אופציונלי)
+            priority (str): מחלקת עדיפות - ברירת מחדל: request_priority, ואחריו ההקשר הנוכחי של המתזמן
+            
+        Returns:
+            requests.Response: התגובה מהשרת
+        """
+        if isinstance(payload, bytes):
+            kwargs['data'] = payload
+        elif payload is not None:
+            kwargs['data'] = self.codec.dumps(payload)
+        if self.scheduler is None:
+            return self.session.request(method, url, **kwargs)
+        with self.scheduler.slot(priority or self.request_priority):
+            return self.session.request(method, url, **kwargs)
+    
+    @staticmethod
+    def _adf(value: Any, markdown: bool = False) -> Dict:
+        """
+        המרת טקסט למסמך ADF (מסמך מוכן מועבר כמו שהוא) - ראה jira_adf.py
+        
+        Args:
+            value (Any): טקסט או מסמך ADF
+            markdown (bool): האם לפענח את הטקסט כמרקדאון
+            
+        Returns:
+            Dict: מסמך ADF
+        """
+        if isinstance(value, dict):
+            return value
+        if markdown:
+            return _lazy('markdown_to_adf')(value)
+        return _lazy('text_to_adf')(value)
+    
+    def _decode(self, response) -> Any:
+        """
+        פענוח גוף התגובה ישירות מה-bytes בעזרת הקודק
+        
+        Args:
+            response (requests.Response): התגובה מהשרת
+            
+        Returns:
+            Any: גוף התגובה המפוענח
+        """
+        return self.codec.loads(response.content)
     
     def test_connection(self) -> bool:
         """
@@ -43,9 +225,9 @@ class JiraIssueManager:
             bool: True אם החיבור תקין, False אחרת
         """
         try:
-            response = requests.get(f"{self.api_url}/myself", headers=self.headers)
+            response = self._request('GET', f"{self.api_url}/myself")
             if response.status_code == 200:
-                user_info = response.json()
+                user_info = self._decode(response)
                 print(f"חיבור מוצלח! מחובר כמשתמש: {user_info.get('displayName', 'לא ידוע')}")
                 return True
             else:
@@ -63,9 +245,9 @@ class JiraIssueManager:
             List[Dict]: רשימת הפרויקטים
         """
         try:
-            response = requests.get(f"{self.api_url}/project", headers=self.headers)
+            response = self._request('GET', f"{self.api_url}/project")
             if response.status_code == 200:
-                return response.json()
+                return self._decode(response)
             else:
                 print(f"שגיאה בקבלת פרויקטים: {response.status_code}")
                 return []
@@ -84,12 +266,12 @@ class JiraIssueManager:
             List[Dict]: רשימת סוגי Issues
         """
         try:
-            response = requests.get(
-                f"{self.api_url}/project/{project_key}/statuses",
-                headers=self.headers
+            response = self._request(
+                'GET',
+                f"{self.api_url}/project/{project_key}/statuses"
             )
             if response.status_code == 200:
-                return response.json()
+                return self._decode(response)
             else:
                 print(f"שגיאה בקבלת סוגי Issues: {response.status_code}")
                 return []
@@ -117,14 +299,14 @@ class JiraIssueManager:
             params['issuetypeNames'] = issue_type
             
         try:
-            response = requests.get(
+            response = self._request(
+                'GET',
                 f"{self.api_url}/issue/createmeta",
-                headers=self.headers,
                 params=params
             )
             
             if response.status_code == 200:
-                return response.json()
+                return self._decode(response)
             else:
                 print(f"שגיאה בקבלת מטא-דאטה: {response.status_code}")
                 return {}
@@ -231,8 +413,14 @@ class JiraIssueManager:
         suggestions = {}
         
         try:
-            # קבלת משתמשים שניתן להקצות
-            assignable_users = self.get_assignable_users(project_key)
+            # קבלת משתמשים שניתן להקצות - מהאינדקס אם כבר נטען, אחרת עמוד אחד בלבד
+            # (קריאה אינטראקטיבית שלא אמורה לעבור על כל המשתמשים)
+            directory = self.user_directory
+            if directory is not None and directory.project_key == project_key \
+                    and directory.loaded_at is not None:
+                assignable_users = directory.users()
+            else:
+                assignable_users = self.get_assignable_users(project_key, max_pages=1)
             if assignable_users:
                 suggestions['assignee'] = [
                     {
@@ -265,36 +453,111 @@ class JiraIssueManager:
             print(f"שגיאה בקבלת הצעות: {str(e)}")
             return {}
 
-    def get_assignable_users(self, project_key: str) -> List[Dict]:
+    def get_assignable_users(self, project_key: str, page_size: int = 1000,
+                             max_pages: int = None) -> List[Dict]:
         """
-        קבלת רשימת משתמשים שניתן להקצות בפרויקט
+        קבלת רשימת המשתמשים שניתן להקצות בפרויקט (כל העמודים, או עד max_pages)
         """
+        users = []
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            page = self.get_users_page(project_key, len(users), page_size)
+            if not page:
+                break
+            users.extend(page)
+            pages += 1
+        return users
+    
+    def get_users_page(self, project_key: str = None, start_at: int = 0,
+                       max_results: int = 1000) -> Optional[List[Dict]]:
+        """
+        קבלת עמוד אחד של משתמשים
+        
+        Args:
+            project_key (str): אם סופק - משתמשים שניתן להקצות בפרויקט, אחרת כל המשתמשים
+            start_at (int): אינדקס המשתמש הראשון בעמוד
+            max_results (int): מספר המשתמשים המקסימלי בעמוד (עד 1000)
+            
+        Returns:
+            Optional[List[Dict]]: המשתמשים בעמוד (רשימה ריקה בסוף) או None אם נכשל
+        """
+        params = {'startAt': start_at, 'maxResults': max_results}
+        if project_key:
+            url = f"{self.api_url}/user/assignable/search"
+            params['project'] = project_key
+        else:
+            url = f"{self.api_url}/users/search"
+        
         try:
-            response = requests.get(
-                f"{self.api_url}/user/assignable/search",
-                headers=self.headers,
-                params={'project': project_key}
+            response = self._request('GET', url, params=params)
+            
+            if response.status_code == 200:
+                return self._decode(response)
+            print(f"שגיאה בקבלת משתמשים: {response.status_code}")
+            return None
+        except Exception as e:
+            print(f"שגיאה בקבלת משתמשים: {str(e)}")
+            return None
+    
+    def search_users(self, query: str, max_results: int = 50) -> List[Dict]:
+        """
+        חיפוש משתמשים לפי שם, אימייל או חלק מהם
+        
+        Args:
+            query (str): מחרוזת החיפוש
+            max_results (int): מספר התוצאות המקסימלי
+            
+        Returns:
+            List[Dict]: המשתמשים שנמצאו
+        """
+        try:
+            response = self._request(
+                'GET',
+                f"{self.api_url}/user/search",
+                params={'query': query, 'maxResults': max_results}
             )
             
             if response.status_code == 200:
-                return response.json()
+                return self._decode(response)
             return []
         except Exception as e:
-            print(f"שגיאה בקבלת משתמשים: {str(e)}")
+            print(f"שגיאה בחיפוש משתמשים: {str(e)}")
             return []
+    
+    def _assignee_field(self, assignee: Any) -> Dict:
+        """
+        המרת assignee לערך השדה - דרך user_directory (accountId) אם הוגדר
+        
+        Args:
+            assignee (Any): accountId, אימייל, שם תצוגה, או ערך שדה מוכן (Dict)
+            
+        Returns:
+            Dict: ערך השדה assignee
+        """
+        if isinstance(assignee, dict):
+            return assignee
+        if self.user_directory is not None:
+            try:
+                account_id = self.user_directory.resolve(assignee)
+            except Exception:
+                # האינדקס לא נטען - שליחה לפי name כמו בלי user_directory
+                account_id = None
+            if account_id:
+                return {"accountId": account_id}
+        return {"name": assignee}
 
     def get_project_components(self, project_key: str) -> List[Dict]:
         """
         קבלת components של הפרויקט
         """
         try:
-            response = requests.get(
-                f"{self.api_url}/project/{project_key}/components",
-                headers=self.headers
+            response = self._request(
+                'GET',
+                f"{self.api_url}/project/{project_key}/components"
             )
             
             if response.status_code == 200:
-                return response.json()
+                return self._decode(response)
             return []
         except Exception as e:
             print(f"שגיאה בקבלת components: {str(e)}")
@@ -305,13 +568,13 @@ class JiraIssueManager:
         קבלת versions של הפרויקט
         """
         try:
-            response = requests.get(
-                f"{self.api_url}/project/{project_key}/versions",
-                headers=self.headers
+            response = self._request(
+                'GET',
+                f"{self.api_url}/project/{project_key}/versions"
             )
             
             if response.status_code == 200:
-                return response.json()
+                return self._decode(response)
             return []
         except Exception as e:
             print(f"שגיאה בקבלת versions: {str(e)}")
@@ -368,17 +631,7 @@ class JiraIssueManager:
             elif field_id == 'description':
                 value = input("  הזן תיאור: ")
                 if value:
-                    issue_fields['description'] = {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [{
-                            "type": "paragraph",
-                            "content": [{
-                                "type": "text",
-                                "text": value
-                            }]
-                        }]
-                    }
+                    issue_fields['description'] = self._adf(value)
                     
             elif 'allowedValues' in field_info and field_info['allowedValues']:
                 print("  ערכים זמינים:")
@@ -401,14 +654,14 @@ class JiraIssueManager:
         
         # יצירת הIssue
         try:
-            response = requests.post(
+            response = self._request(
+                'POST',
                 f"{self.api_url}/issue",
-                headers=self.headers,
-                data=json.dumps({"fields": issue_fields})
+                payload={"fields": issue_fields}
             )
             
             if response.status_code == 201:
-                created_issue = response.json()
+                created_issue = self._decode(response)
                 print(f"\n✅ Issue נוצר בהצלחה: {created_issue['key']}")
                 return created_issue
             else:
@@ -460,21 +713,24 @@ class JiraIssueManager:
                 return False
                 
         return True
+
+    def create_issue(self, project_key: str, summary: str, description: str = "",
                     issue_type: str = "Task", priority: str = "Medium",
                     assignee: str = None, labels: List[str] = None,
-                    custom_fields: Dict[str, Any] = None) -> Optional[Dict]:
+                    custom_fields: Dict[str, Any] = None, markdown: bool = False) -> Optional[Dict]:
         """
         יצירת Issue חדש
         
         Args:
             project_key (str): מפתח הפרויקט
             summary (str): כותרת הIssue
-            description (str): תיאור הIssue
+            description (str): תיאור הIssue (או מסמך ADF מוכן)
             issue_type (str): סוג הIssue (Task, Bug, Story וכו')
             priority (str): עדיפות (Highest, High, Medium, Low, Lowest)
-            assignee (str): שם המשתמש למי להקצות
+            assignee (str): למי להקצות - accountId, אימייל או שם תצוגה (מתורגם דרך user_directory אם הוגדר)
             labels (List[str]): תוויות
             custom_fields (Dict): שדות מותאמים אישית
+            markdown (bool): האם לפענח את התיאור כמרקדאון
             
         Returns:
             Optional[Dict]: מידע על הIssue שנוצר או None אם נכשל
@@ -483,30 +739,12 @@ class JiraIssueManager:
             "fields": {
                 "project": {"key": project_key},
                 "summary": summary,
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": description
-                                }
-                            ]
-                        }
-                    ]
-                },
+                "description": self._adf(description, markdown),
                 "issuetype": {"name": issue_type},
                 "priority": {"name": priority}
             }
         }
         
-        # הוספת assignee אם סופק
-        if assignee:
-            issue_data["fields"]["assignee"] = {"name": assignee}
-        
         # הוספת labels אם סופקו
         if labels:
             issue_data["fields"]["labels"] = labels
@@ -516,14 +754,18 @@ class JiraIssueManager:
             issue_data["fields"].update(custom_fields)
         
         try:
-            response = requests.post(
+            # הוספת assignee אם סופק (ערך מ-custom_fields גובר, כמו קודם)
+            if assignee and "assignee" not in issue_data["fields"]:
+                issue_data["fields"]["assignee"] = self._assignee_field(assignee)
+            
+            response = self._request(
+                'POST',
                 f"{self.api_url}/issue",
-                headers=self.headers,
-                data=json.dumps(issue_data)
+                payload=issue_data
             )
             
             if response.status_code == 201:
-                created_issue = response.json()
+                created_issue = self._decode(response)
                 print(f"Issue נוצר בהצלחה: {created_issue['key']}")
                 return created_issue
             else:
@@ -546,13 +788,13 @@ class JiraIssueManager:
             Optional[Dict]: מידע על הIssue או None אם לא נמצא
         """
         try:
-            response = requests.get(
-                f"{self.api_url}/issue/{issue_key}",
-                headers=self.headers
+            response = self._request(
+                'GET',
+                f"{self.api_url}/issue/{issue_key}"
             )
             
             if response.status_code == 200:
-                return response.json()
+                return self._decode(response)
             else:
                 print(f"שגיאה בקבלת Issue: {response.status_code}")
                 return None
@@ -572,13 +814,16 @@ class JiraIssueManager:
         Returns:
             bool: True אם העדכון הצליח, False אחרת
         """
-        update_data = {"fields": fields}
-        
         try:
-            response = requests.put(
+            if isinstance(fields.get('assignee'), str):
+                fields = dict(fields, assignee=self._assignee_field(fields['assignee']))
+            
+            update_data = {"fields": fields}
+            
+            response = self._request(
+                'PUT',
                 f"{self.api_url}/issue/{issue_key}",
-                headers=self.headers,
-                data=json.dumps(update_data)
+                payload=update_data
             )
             
             if response.status_code == 204:
@@ -604,9 +849,9 @@ class JiraIssueManager:
             bool: True אם המחיקה הצליחה, False אחרת
         """
         try:
-            response = requests.delete(
-                f"{self.api_url}/issue/{issue_key}",
-                headers=self.headers
+            response = self._request(
+                'DELETE',
+                f"{self.api_url}/issue/{issue_key}"
             )
             
             if response.status_code == 204:
@@ -620,73 +865,121 @@ class JiraIssueManager:
             print(f"שגיאה במחיקת Issue: {str(e)}")
             return False
     
-    def search_issues(self, jql: str, max_results: int = 50) -> List[Dict]:
+    def search_issues_page(self, jql: str, start_at: int = 0, max_results: int = 50,
+                           fields: List[str] = None, priority: str = None,
+                           validate_query: str = None) -> Optional[Dict]:
         """
-        חיפוש Issues באמצעות JQL
+        קבלת עמוד אחד של תוצאות חיפוש JQL, כולל מידע על העימוד
         
         Args:
             jql (str): שאילתת JQL
-            max_results (int): מספר התוצאות המקסימלי
+            start_at (int): אינדקס התוצאה הראשונה בעמוד
+            max_results (int): מספר התוצאות המקסימלי בעמוד
+            fields (List[str]): השדות להחזרה (אופציונלי - ברירת מחדל של ג'ירה)
+            priority (str): מחלקת עדיפות במתזמן (אופציונלי)
+            validate_query (str): strict, warn או none - ב-warn מפתח שלא קיים מחזיר
+                אזהרה ב-warningMessages במקום שגיאת 400 (אופציונלי)
             
         Returns:
-            List[Dict]: רשימת Issues שנמצאו
+            Optional[Dict]: העמוד (issues, total, startAt, maxResults) או None אם נכשל
         """
         search_data = {
             "jql": jql,
+            "startAt": start_at,
             "maxResults": max_results
         }
         
+        if fields:
+            search_data["fields"] = fields
+        
+        if validate_query:
+            search_data["validateQuery"] = validate_query
+        
         try:
-            response = requests.post(
+            response = self._request(
+                'POST',
                 f"{self.api_url}/search",
-                headers=self.headers,
-                data=json.dumps(search_data)
+                payload=search_data,
+                priority=priority
             )
             
             if response.status_code == 200:
-                return response.json().get("issues", [])
+                return self.codec.loads_search_page(response.content)
             else:
                 print(f"שגיאה בחיפוש: {response.status_code}")
-                return []
+                return None
                 
         except Exception as e:
             print(f"שגיאה בחיפוש: {str(e)}")
+            return None
+    
+    def search_issues(self, jql: str, max_results: int = 50, start_at: int = 0,
+                      fields: List[str] = None) -> List[Dict]:
+        """
+        חיפוש Issues באמצעות JQL
+        
+        Args:
+            jql (str): שאילתת JQL
+            max_results (int): מספר התוצאות המקסימלי
+            start_at (int): אינדקס התוצאה הראשונה (לעימוד)
+            fields (List[str]): השדות להחזרה (אופציונלי)
+            
+        Returns:
+            List[Dict]: רשימת Issues שנמצאו
+        """
+        page = self.search_issues_page(jql, start_at, max_results, fields)
+        if page is None:
             return []
+        return page.get("issues", [])
     
-    def add_comment(self, issue_key: str, comment: str) -> bool:
+    def iter_issues(self, jql: str, page_size: int = 100, fields: List[str] = None,
+                    priority: str = 'batch'):
+        """
+        מעבר על כל תוצאות החיפוש, עמוד אחר עמוד
+        
+        Args:
+            jql (str): שאילתת JQL
+            page_size (int): מספר התוצאות בכל בקשה
+            fields (List[str]): השדות להחזרה (אופציונלי)
+            priority (str): מחלקת עדיפות במתזמן - ברירת מחדל batch, כי זה מסלול הייצוא
+            
+        Yields:
+            Dict: Issue אחד בכל פעם
+        """
+        start_at = 0
+        while True:
+            page = self.search_issues_page(jql, start_at, page_size, fields, priority)
+            if not page:
+                return
+            issues = page.get("issues", [])
+            yield from issues
+            start_at += len(issues)
+            if not issues or start_at >= page.get("total", 0):
+                return
+    
+    def add_comment(self, issue_key: str, comment: Any, markdown: bool = False) -> bool:
         """
         הוספת תגובה לIssue
         
         Args:
             issue_key (str): מפתח הIssue
-            comment (str): התגובה
+            comment (Any): התגובה - טקסט, מסמך ADF מוכן (Dict), או JSON מוכן של מסמך (bytes,
+                למשל מ-adf_template(...).render_json())
+            markdown (bool): האם לפענח את הטקסט כמרקדאון
             
         Returns:
             bool: True אם התגובה נוספה בהצלחה, False אחרת
         """
-        comment_data = {
-            "body": {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": comment
-                            }
-                        ]
-                    }
-                ]
-            }
-        }
+        if isinstance(comment, bytes):
+            comment_data = b'{"body":' + comment + b'}'
+        else:
+            comment_data = {"body": self._adf(comment, markdown)}
         
         try:
-            response = requests.post(
+            response = self._request(
+                'POST',
                 f"{self.api_url}/issue/{issue_key}/comment",
-                headers=self.headers,
-                data=json.dumps(comment_data)
+                payload=comment_data
             )
             
             if response.status_code == 201:
@@ -711,13 +1004,13 @@ class JiraIssueManager:
             List[Dict]: רשימת מעברי סטטוס זמינים
         """
         try:
-            response = requests.get(
-                f"{self.api_url}/issue/{issue_key}/transitions",
-                headers=self.headers
+            response = self._request(
+                'GET',
+                f"{self.api_url}/issue/{issue_key}/transitions"
             )
             
             if response.status_code == 200:
-                return response.json().get("transitions", [])
+                return self._decode(response).get("transitions", [])
             else:
                 print(f"שגיאה בקבלת מעברי סטטוס: {response.status_code}")
                 return []
@@ -744,10 +1037,10 @@ class JiraIssueManager:
         }
         
         try:
-            response = requests.post(
+            response = self._request(
+                'POST',
                 f"{self.api_url}/issue/{issue_key}/transitions",
-                headers=self.headers,
-                data=json.dumps(transition_data)
+                payload=transition_data
             )
             
             if response.status_code == 204:
@@ -762,40 +1055,8 @@ class JiraIssueManager:
             return False
 
 
-# דוגמא לשימוש
+# הרצה משורת הפקודה - ראה jira_cli.py (import, export, transition, comment)
 if __name__ == "__main__":
-    # יצירת מופע של המחלקה
-    jira = JiraIssueManager(
-        base_url="https://your-domain.atlassian.net",
-        username="your-email@example.com",
-        token="your-api-token"
-    )
-    
-    # בדיקת חיבור
-    if jira.test_connection():
-        # יצירת Issue חדש
-        new_issue = jira.create_issue(
-            project_key="PROJ",
-            summary="Issue חדש מהקוד",
-            description="זהו תיאור של הIssue החדש",
-            issue_type="Task",
-            priority="High",
-            labels=["api", "python"]
-        )
-        
-        if new_issue:
-            issue_key = new_issue["key"]
-            print(f"נוצר Issue: {issue_key}")
-            
-            # הוספת תגובה
-            jira.add_comment(issue_key, "תגובה מהקוד")
-            
-            # קבלת מידע על הIssue
-            issue_info = jira.get_issue(issue_key)
-            if issue_info:
-                print(f"כותרת: {issue_info['fields']['summary']}")
-                print(f"סטטוס: {issue_info['fields']['status']['name']}")
-    
-    # חיפוש Issues
-    results = jira.search_issues("project = PROJ AND status = 'To Do'")
-    print(f"נמצאו {len(results)} Issues")
+    import sys
+    from jira_cli import main
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+מיקרו-בנצ'מרק לבניית גופי תגובות ADF (כולל המרה ל-JSON בקודק)
+
+משווה בין בניית המסמך בכל קריאה (טקסט רגיל / מרקדאון) לבין תבנית
+ממוטמנת שמשנה רק את הפרמטרים - התרחיש של בוטים שמוסיפים תגובות CI.
+
+שימוש:
+    python bench_adf.py [--number 20000]
+"""
+
+import argparse
+import sys
+import timeit
+from string import Template
+
+from jira_adf import markdown_to_adf, template, text_to_adf
+from jira_codec import get_codec
+
+
+CI_COMMENT = """## Build $status
+
+Pipeline **$pipeline** on branch `$branch` finished in $duration.
+
+- Tests: $passed passed, $failed failed
+- Commit: [$commit]($commit_url)
+- Log: [build log]($log_url)
+
+_Posted automatically by CI._"""
+
+PARAMS = {
+    'status': 'failed',
+    'pipeline': 'unit-tests',
+    'branch': 'main',
+    'duration': '3m 12s',
+    'passed': '1204',
+    'failed': '3',
+    'commit': 'a1b2c3d',
+    'commit_url': 'https://git.example.com/commit/a1b2c3d',
+    'log_url': 'https://ci.example.com/build/4242',
+}
+
+RENDERED = Template(CI_COMMENT).substitute(PARAMS)
+
+
+def legacy_single_paragraph(text: str):
+    """
+    הגוף שנבנה ידנית ב-add_comment לפני jira_adf (פסקה אחת)
+    """
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ADF builder micro-benchmark")
+    parser.add_argument('--number', type=int, default=20000, help="מספר חזרות לכל מקרה")
+    args = parser.parse_args()
+
+    codec = get_codec()
+    ci_template = template(CI_COMMENT)
+
+    # (שם, בניית הגוף, בניית גוף הבקשה המלא כ-bytes)
+    cases = [
+        ("legacy dict, one line",
+         lambda: legacy_single_paragraph("Build failed"), None),
+        ("text_to_adf, one line",
+         lambda: text_to_adf("Build failed"), None),
+        ("text_to_adf, CI comment",
+         lambda: text_to_adf(RENDERED), None),
+        ("markdown_to_adf, CI comment",
+         lambda: markdown_to_adf(RENDERED), None),
+        ("template().render, CI comment",
+         lambda: template(CI_COMMENT).render(**PARAMS), None),
+        ("cached template render, CI comment",
+         lambda: ci_template.render(**PARAMS), None),
+        ("cached template render_json, CI comment",
+         lambda: ci_template.render_json(**PARAMS),
+         lambda: b'{"body":' + ci_template.render_json(**PARAMS) + b'}'),
+    ]
+
+    print(f"codec: {codec.name}, {args.number} iterations per case")
+    print(f"{'case':<42}{'build µs':>10}{'payload µs':>12}")
+    for label, build, payload in cases:
+        if payload is None:
+            payload = lambda build=build: codec.dumps({"body": build()})
+        build_time = timeit.timeit(build, number=args.number) / args.number * 1e6
+        total_time = timeit.timeit(payload, number=args.number) / args.number * 1e6
+        print(f"{label:<42}{build_time:>10.2f}{total_time:>12.2f}")
+
+    # בדיקת שפיות: התבנית מייצרת את אותו מסמך כמו המרה ישירה של הטקסט המוחלף
+    expected = markdown_to_adf(RENDERED)
+    if ci_template.render(**PARAMS) != expected or \
+            codec.loads(ci_template.render_json(**PARAMS)) != expected:
+        print("❌ התבנית לא מייצרת את אותו מסמך כמו markdown_to_adf")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
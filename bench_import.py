@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+מדידת זמן הייבוא של Jira.py - `python -c "import Jira"` צריך להישאר מהיר
+עבור hooks קצרים (למשל git hook שמוסיף תגובה)
+
+שימוש:
+    python bench_import.py [--runs 20] [--budget-ms 50]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+# מודולים שאסור להם להיטען בזמן `import Jira`
+HEAVY_MODULES = ['requests', 'urllib3', 'json', 'charset_normalizer', 'idna', 'certifi']
+
+# בודקים רק מודולים שלא היו טעונים כבר לפני הייבוא (חלק מהסביבות טוענות certifi דרך .pth)
+CHECK_SCRIPT = (
+    "import sys; before = set(sys.modules); import Jira; "
+    f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules and m not in before))"
+)
+
+
+def time_import(runs: int) -> list:
+    """
+    הרצת `python -c "import Jira"` בתהליך נפרד מספר פעמים
+
+    Args:
+        runs (int): מספר ההרצות
+
+    Returns:
+        list: זמני הריצה במילישניות (כולל עליית המפרש)
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'import Jira'], check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def time_baseline(runs: int) -> list:
+    """
+    זמני עליית מפרש ריק - לחיסור מהמדידה
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import-time benchmark for Jira.py")
+    parser.add_argument('--runs', type=int, default=20, help="מספר הרצות")
+    parser.add_argument('--budget-ms', type=float, default=50.0,
+                        help="תקציב מקסימלי (מילישניות) לייבוא מעבר לעליית המפרש")
+    args = parser.parse_args()
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    loaded = subprocess.run(
+        [sys.executable, '-c', CHECK_SCRIPT], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+    baseline = statistics.median(time_baseline(args.runs))
+    jira = statistics.median(time_import(args.runs))
+    overhead = jira - baseline
+
+    print(f"interpreter startup: {baseline:.1f} ms (median of {args.runs})")
+    print(f"import Jira:         {jira:.1f} ms (median of {args.runs})")
+    print(f"import overhead:     {overhead:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    failed = False
+    if loaded:
+        print(f"❌ מודולים כבדים נטענו בזמן import: {loaded}")
+        failed = True
+    if overhead > args.budget_ms:
+        print("❌ זמן הייבוא חורג מהתקציב")
+        failed = True
+    if not failed:
+        print("✅ הייבוא מהיר ולא טוען מודולים כבדים")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,484 @@
+"""
+בניית מסמכי Atlassian Document Format (ADF) מטקסט רגיל וממרקדאון
+
+- text_to_adf: טקסט רגיל - פסקאות לפי שורה ריקה, ירידת שורה כ-hardBreak.
+  לשורה אחת יש מסלול מהיר שבונה את המסמך ישירות.
+- markdown_to_adf / iter_markdown_blocks: ממיר מרקדאון בסיסי שורה אחר שורה
+  (כותרות, רשימות, ציטוטים, בלוקי קוד, קו מפריד, ודגשים בתוך השורה).
+- AdfTemplate / template: תבנית עם פרמטרים ($name או ${name}) שמפוענחת
+  פעם אחת; render מעתיק רק את הצמתים שבהם יש פרמטרים, וכל השאר משותף
+  עם התבנית - לכן את המסמך שמוחזר יש לשלוח ולא לשנות. render_json מדלג
+  גם על בניית המילון ומחזיר JSON מוכן - זה המסלול המהיר לשליחה.
+
+דוגמה:
+    ci_comment = template("**Build $status** - [log]($url)")
+    jira.add_comment("PROJ-1", ci_comment.render_json(status="passed", url=build_url))
+"""
+
+import functools
+import json
+import re
+import uuid
+from string import Template
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+_HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+_RULE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+_BULLET = re.compile(r'^\s*[-*+]\s+(.*)$')
+_ORDERED = re.compile(r'^\s*(\d+)[.)]\s+(.*)$')
+_QUOTE = re.compile(r'^\s*>\s?(.*)$')
+_FENCE = re.compile(r'^\s*(```|~~~)\s*([\w+#.-]*)\s*$')
+
+_INLINE = re.compile(
+    r'`(?P<code>[^`]+)`'
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<href>[^)\s]+)\)'
+    r'|\*\*\*(?P<strong_em>.+?)\*\*\*'
+    r'|\*\*(?P<strong>.+?)\*\*'
+    r'|(?<!\w)__(?P<strong2>(?!\s).+?(?<!\s))__(?!\w)'
+    r'|~~(?P<strike>.+?)~~'
+    r'|\*(?P<em>(?!\s).+?(?<!\s))\*'
+    r'|(?<!\w)_(?P<em2>(?!\s).+?(?<!\s))_(?!\w)'
+)
+# אם אין אף אחד מהתווים האלה - אין דגשים בשורה
+_INLINE_CHARS = re.compile(r'[`\[*~_]')
+
+_BLANK_LINES = re.compile(r'\n\s*\n')
+
+# תווים שמחייבים escape במחרוזת JSON
+_JSON_ESCAPE = re.compile(r'[\x00-\x1f"\\\u2028\u2029]')
+
+
+def _doc(content: List[Dict]) -> Dict:
+    return {"type": "doc", "version": 1, "content": content}
+
+
+def _text(text: str, marks: Tuple[Dict, ...] = ()) -> Dict:
+    node = {"type": "text", "text": text}
+    if marks:
+        node["marks"] = list(marks)
+    return node
+
+
+def _with_mark(marks: Tuple[Dict, ...], mark: Dict) -> Tuple[Dict, ...]:
+    """
+    הוספת סימון בלי כפילויות - ב-ADF כל סוג סימון מופיע פעם אחת, ו-code
+    מותר רק יחד עם link
+    """
+    if mark["type"] == "code":
+        return tuple(m for m in marks if m["type"] == "link") + (mark,)
+    if any(m["type"] in (mark["type"], "code") for m in marks):
+        return marks
+    return marks + (mark,)
+
+
+def _paragraph(content: List[Dict]) -> Dict:
+    return {"type": "paragraph", "content": content}
+
+
+def _lines_to_inline(lines: List[str], markdown: bool) -> List[Dict]:
+    """
+    שורות של פסקה אחת -> צמתי טקסט עם hardBreak ביניהן
+    """
+    content = []
+    for index, line in enumerate(lines):
+        if index:
+            content.append({"type": "hardBreak"})
+        if markdown:
+            content.extend(inline_to_adf(line))
+        elif line:
+            content.append(_text(line))
+    return content
+
+
+def inline_to_adf(text: str, marks: Tuple[Dict, ...] = ()) -> List[Dict]:
+    """
+    המרת שורת מרקדאון לצמתי טקסט (bold, italic, strike, code, links)
+
+    Args:
+        text (str): השורה
+        marks (Tuple[Dict]): סימונים שחלים על כל השורה (לקינון)
+
+    Returns:
+        List[Dict]: צמתי text של ADF
+    """
+    if not text:
+        return []
+    if not _INLINE_CHARS.search(text):
+        return [_text(text, marks)]
+
+    nodes = []
+    position = 0
+    for match in _INLINE.finditer(text):
+        if match.start() > position:
+            nodes.append(_text(text[position:match.start()], marks))
+        position = match.end()
+
+        if match.group('code') is not None:
+            nodes.append(_text(match.group('code'), _with_mark(marks, {"type": "code"})))
+        elif match.group('href') is not None:
+            link = {"type": "link", "attrs": {"href": match.group('href')}}
+            nodes.extend(inline_to_adf(match.group('link_text'), _with_mark(marks, link)))
+        elif match.group('strong_em') is not None:
+            inner = _with_mark(_with_mark(marks, {"type": "strong"}), {"type": "em"})
+            nodes.extend(inline_to_adf(match.group('strong_em'), inner))
+        elif match.group('strong') is not None or match.group('strong2') is not None:
+            strong = match.group('strong') if match.group('strong') is not None else match.group('strong2')
+            nodes.extend(inline_to_adf(strong, _with_mark(marks, {"type": "strong"})))
+        elif match.group('strike') is not None:
+            nodes.extend(inline_to_adf(match.group('strike'), _with_mark(marks, {"type": "strike"})))
+        else:
+            emphasis = match.group('em') if match.group('em') is not None else match.group('em2')
+            nodes.extend(inline_to_adf(emphasis, _with_mark(marks, {"type": "em"})))
+
+    if position < len(text):
+        nodes.append(_text(text[position:], marks))
+    return nodes
+
+
+def text_to_adf(text: Optional[str]) -> Dict:
+    """
+    המרת טקסט רגיל למסמך ADF
+
+    Args:
+        text (str): הטקסט - פסקאות מופרדות בשורה ריקה
+
+    Returns:
+        Dict: מסמך ADF
+    """
+    if not text:
+        return _doc([])
+    if '\n' not in text:
+        return _doc([_paragraph([_text(text)])])
+    return _doc([
+        _paragraph(_lines_to_inline(block.split('\n'), markdown=False))
+        for block in _BLANK_LINES.split(text.strip('\n'))
+        if block.strip()
+    ])
+
+
+def iter_markdown_blocks(lines: Iterable[str]) -> Iterator[Dict]:
+    """
+    המרת מרקדאון לבלוקים של ADF שורה אחר שורה - כל בלוק מוחזר ברגע שהסתיים
+
+    רשימות מקוננות מושטחות לרמה אחת.
+
+    Args:
+        lines (Iterable[str]): שורות המרקדאון (למשל קובץ פתוח)
+
+    Yields:
+        Dict: בלוק ADF (paragraph, heading, bulletList, orderedList, blockquote, codeBlock, rule)
+    """
+    paragraph: List[str] = []
+    quote: List[str] = []
+    list_node: Optional[Dict] = None
+    fence: Optional[str] = None
+    code: List[str] = []
+    language = ''
+
+    def flush():
+        nonlocal paragraph, quote, list_node
+        if paragraph:
+            yield _paragraph(_lines_to_inline(paragraph, markdown=True))
+            paragraph = []
+        if quote:
+            yield {"type": "blockquote",
+                   "content": [_paragraph(_lines_to_inline(quote, markdown=True))]}
+            quote = []
+        if list_node is not None:
+            yield list_node
+            list_node = None
+
+    for line in lines:
+        line = line.rstrip('\r\n')
+
+        if fence is not None:
+            match = _FENCE.match(line)
+            if match and match.group(1) == fence and not match.group(2):
+                block = {"type": "codeBlock", "content": [_text('\n'.join(code))] if code else []}
+                if language:
+                    block["attrs"] = {"language": language}
+                yield block
+                fence, code = None, []
+            else:
+                code.append(line)
+            continue
+
+        if not line.strip():
+            yield from flush()
+            continue
+
+        match = _FENCE.match(line)
+        if match:
+            yield from flush()
+            fence, language = match.group(1), match.group(2)
+            continue
+
+        match = _HEADING.match(line)
+        if match:
+            yield from flush()
+            yield {"type": "heading", "attrs": {"level": len(match.group(1))},
+                   "content": inline_to_adf(match.group(2))}
+            continue
+
+        if _RULE.match(line):
+            yield from flush()
+            yield {"type": "rule"}
+            continue
+
+        bullet = _BULLET.match(line)
+        ordered = None if bullet else _ORDERED.match(line)
+        if bullet or ordered:
+            list_type = "bulletList" if bullet else "orderedList"
+            if list_node is None or list_node["type"] != list_type or paragraph or quote:
+                yield from flush()
+                list_node = {"type": list_type, "content": []}
+                if ordered:
+                    list_node["attrs"] = {"order": int(ordered.group(1))}
+            item_text = bullet.group(1) if bullet else ordered.group(2)
+            list_node["content"].append(
+                {"type": "listItem", "content": [_paragraph(inline_to_adf(item_text))]}
+            )
+            continue
+
+        match = _QUOTE.match(line)
+        if match:
+            if not quote:
+                yield from flush()
+            quote.append(match.group(1))
+            continue
+
+        if list_node is not None or quote:
+            yield from flush()
+        paragraph.append(line)
+
+    if fence is not None:
+        # בלוק קוד שלא נסגר - נשמר כמו שהוא
+        block = {"type": "codeBlock", "content": [_text('\n'.join(code))] if code else []}
+        if language:
+            block["attrs"] = {"language": language}
+        yield block
+    yield from flush()
+
+
+def markdown_to_adf(markdown) -> Dict:
+    """
+    המרת מרקדאון למסמך ADF
+
+    Args:
+        markdown (str | Iterable[str]): טקסט המרקדאון או שורות שלו
+
+    Returns:
+        Dict: מסמך ADF
+    """
+    if isinstance(markdown, str):
+        if not markdown:
+            return _doc([])
+        markdown = markdown.split('\n')
+    return _doc(list(iter_markdown_blocks(markdown)))
+
+
+class AdfTemplate:
+    """
+    מסמך ADF עם פרמטרים ($name / ${name}) בטקסט ובקישורים
+
+    המסמך נבנה פעם אחת. render מחליף רק את המחרוזות שמכילות פרמטרים ומעתיק
+    רק את הצמתים שבדרך אליהן; ערכי הפרמטרים נכנסים כטקסט ולא מפוענחים כמרקדאון.
+    """
+
+    def __init__(self, source: str, markdown: bool = True):
+        """
+        Args:
+            source (str): טקסט התבנית
+            markdown (bool): האם לפענח את התבנית כמרקדאון (אחרת טקסט רגיל)
+        """
+        self.source = source
+        self.document = markdown_to_adf(source) if markdown else text_to_adf(source)
+        # עץ של המסלולים בלבד: מפתח -> תת-עץ, או _Slot במחרוזת עם פרמטרים
+        self._plan = self._compile(self.document) or {}
+        # אותו עץ כ-tuples של (מפתח, מחרוזת format, תת-עץ) - ל-render בלי בדיקות טיפוס
+        self._steps = _compile_steps(self._plan)
+        # JSON מוכן של המסמך כזוגות (JSON קבוע, שם פרמטר) - נבנה בקריאה הראשונה ל-render_json
+        self._json_parts: Optional[List[Tuple[str, Optional[str]]]] = None
+
+    @property
+    def identifiers(self) -> List[str]:
+        """
+        שמות הפרמטרים בתבנית
+        """
+        names: List[str] = []
+
+        def walk(plan):
+            for value in plan.values():
+                if isinstance(value, _Slot):
+                    names.extend(name for _, name in value.parts if name and name not in names)
+                else:
+                    walk(value)
+
+        walk(self._plan)
+        return names
+
+    @classmethod
+    def _compile(cls, node) -> Optional[Dict]:
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        plan = {}
+        for key, value in items:
+            if isinstance(value, str):
+                if '$' in value and key in ('text', 'href'):
+                    slot = _Slot.compile(value)
+                    if slot is not None:
+                        plan[key] = slot
+            elif isinstance(value, (dict, list)):
+                sub_plan = cls._compile(value)
+                if sub_plan:
+                    plan[key] = sub_plan
+        return plan or None
+
+    def render(self, **params) -> Dict:
+        """
+        יצירת מסמך עם ערכי הפרמטרים
+
+        Args:
+            **params: ערך לכל פרמטר בתבנית
+
+        Returns:
+            Dict: מסמך ADF (חלקים ממנו משותפים עם התבנית - אין לשנות אותו)
+        """
+        if not self._steps:
+            return self.document
+        return _apply(self.document, self._steps, params)
+
+    def render_json(self, **params) -> bytes:
+        """
+        JSON (UTF-8) של המסמך עם ערכי הפרמטרים - בלי לבנות את המילון בכלל
+
+        ה-JSON של החלקים הקבועים מחושב פעם אחת, וכל render מחבר אליו את
+        הפרמטרים. מתאים לשליחה ישירה: jira.add_comment(key, template.render_json(...))
+
+        Args:
+            **params: ערך לכל פרמטר בתבנית
+
+        Returns:
+            bytes: המסמך כ-JSON
+        """
+        if self._json_parts is None:
+            self._json_parts = self._split_json()
+        out = []
+        for literal, name in self._json_parts:
+            out.append(literal)
+            if name is not None:
+                value = str(params[name])
+                if _JSON_ESCAPE.search(value) is not None:
+                    value = json.dumps(value, ensure_ascii=False)[1:-1]
+                out.append(value)
+        return ''.join(out).encode('utf-8')
+
+    def _split_json(self) -> List[Tuple[str, Optional[str]]]:
+        """
+        סימון כל מחרוזת עם פרמטרים במחרוזת ייחודית, המרה ל-JSON ופיצול סביב
+        הסימונים לזוגות (JSON קבוע, שם פרמטר)
+        """
+        token = f"adf-slot-{uuid.uuid4().hex}-"
+        slots: List[_Slot] = []
+
+        def mark(node, plan):
+            copy = list(node) if isinstance(node, list) else dict(node)
+            for key, sub_plan in plan.items():
+                if isinstance(sub_plan, _Slot):
+                    copy[key] = f"{token}{len(slots)}"
+                    slots.append(sub_plan)
+                else:
+                    copy[key] = mark(node[key], sub_plan)
+            return copy
+
+        marked = mark(self.document, self._plan) if self._plan else self.document
+        encoded = json.dumps(marked, ensure_ascii=False, separators=(',', ':'))
+        pieces = re.split(f'"{token}(\\d+)"', encoded)
+
+        parts = []
+        literal = pieces[0]
+        for position in range(1, len(pieces), 2):
+            literal += '"'
+            for text, name in slots[int(pieces[position])].parts:
+                literal += json.dumps(text, ensure_ascii=False)[1:-1]
+                if name:
+                    parts.append((literal, name))
+                    literal = ''
+            literal += '"' + pieces[position + 1]
+        parts.append((literal, None))
+        return parts
+
+
+class _Slot:
+    """
+    מחרוזת עם פרמטרים, מפורקת מראש לזוגות (טקסט קבוע, שם פרמטר)
+    """
+
+    __slots__ = ('parts', 'format')
+
+    def __init__(self, parts: List[Tuple[str, Optional[str]]]):
+        self.parts = parts
+        # אותה מחרוזת כתבנית של str.format_map - החלפה בקריאה אחת
+        self.format = ''.join(
+            literal.replace('{', '{{').replace('}', '}}') + (f'{{{name}}}' if name else '')
+            for literal, name in parts
+        )
+
+    @classmethod
+    def compile(cls, value: str) -> Optional['_Slot']:
+        parts = []
+        literal = []
+        position = 0
+        for match in Template.pattern.finditer(value):
+            if match.group('invalid') is not None:
+                # "$5" וכדומה - לא פרמטר, נשאר כטקסט
+                continue
+            literal.append(value[position:match.start()])
+            position = match.end()
+            if match.group('escaped') is not None:
+                literal.append('$')
+            else:
+                parts.append((''.join(literal), match.group('named') or match.group('braced')))
+                literal = []
+        if position == 0:
+            return None
+        literal.append(value[position:])
+        parts.append((''.join(literal), None))
+        return cls(parts)
+
+    def render(self, params: Dict) -> str:
+        return self.format.format_map(params)
+
+
+# צעד ב-render: (מפתח, מחרוזת format או None, תת-צעדים או None)
+_Step = Tuple[object, Optional[str], Optional[tuple]]
+
+
+def _compile_steps(plan: Dict) -> Tuple[_Step, ...]:
+    return tuple(
+        (key, sub_plan.format, None) if isinstance(sub_plan, _Slot)
+        else (key, None, _compile_steps(sub_plan))
+        for key, sub_plan in plan.items()
+    )
+
+
+def _apply(node, steps: Tuple[_Step, ...], params: Dict):
+    copy = node.copy()
+    for key, fmt, sub_steps in steps:
+        copy[key] = fmt.format_map(params) if sub_steps is None else _apply(node[key], sub_steps, params)
+    return copy
+
+
+@functools.lru_cache(maxsize=256)
+def template(source: str, markdown: bool = True) -> AdfTemplate:
+    """
+    תבנית ADF ממוטמנת - קריאות חוזרות עם אותו טקסט מחזירות את אותה תבנית
+
+    Args:
+        source (str): טקסט התבנית
+        markdown (bool): האם לפענח כמרקדאון
+
+    Returns:
+        AdfTemplate: התבנית
+    """
+    return AdfTemplate(source, markdown)
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+ממשק שורת פקודה לעבודות אצווה מול ג'ירה
+
+פקודות:
+    import      ייבוא Issues מקובץ CSV או JSONL
+    export      ייצוא תוצאות של שאילתת JQL ל-JSONL או CSV
+    transition  מעבר סטטוס מרוכז
+    comment     הוספת תגובה מרוכזת
+
+פרטי ההתחברות נלקחים מ- --url/--user/--token או ממשתני הסביבה
+JIRA_URL, JIRA_USER, JIRA_TOKEN.
+
+ב-import, עמודות מעבר לשדות הבסיסיים נשלחות רק אם שמן הוא מזהה שדה
+(customfield_10016, components, fixVersions וכו'). בקובץ CSV תא שמתחיל
+ב-{, [ או " מפוענח כ-JSON (למשל {"value": "High"}), תא מספרי נשלח כמספר,
+ו-components/fixVersions/versions מקבלים גם רשימת שמות מופרדת בפסיקים.
+
+דוגמאות:
+    python jira_cli.py import issues.csv --project PROJ --concurrency 16
+    python jira_cli.py export "project = PROJ" -o out.jsonl --page-size 100
+    python jira_cli.py transition --jql "project = PROJ AND status = 'To Do'" --to Done
+    python jira_cli.py comment --keys keys.txt --text "נבדק ב-CI" --rate-limit 20
+"""
+
+import argparse
+import csv
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from Jira import JiraIssueManager
+from jira_scheduler import BATCH, RequestScheduler
+
+
+# עמודות ב-CSV/JSONL שממופות לפרמטרים של create_issue - כל השאר נשלח כשדות מותאמים אישית
+IMPORT_COLUMNS = {
+    'project': 'project_key',
+    'project_key': 'project_key',
+    'summary': 'summary',
+    'description': 'description',
+    'issuetype': 'issue_type',
+    'issue_type': 'issue_type',
+    'priority': 'priority',
+    'assignee': 'assignee',
+    'labels': 'labels',
+}
+
+# מזהי שדות מערכת שמועברים כמו שהם (מפתח באותיות קטנות -> המזהה בג'ירה)
+SYSTEM_FIELDS = {
+    name.lower(): name for name in (
+        'components', 'fixVersions', 'versions', 'duedate', 'environment',
+        'reporter', 'parent', 'timetracking', 'security', 'resolution',
+    )
+}
+
+# שדות מערכת שמקבלים רשימת {"name": ...} - בתא CSV מספיקה רשימה מופרדת בפסיקים
+NAMED_LIST_FIELDS = {'components', 'fixVersions', 'versions'}
+
+_CUSTOM_FIELD = re.compile(r'^customfield_\d+$')
+_NUMBER = re.compile(r'^-?\d+(\.\d+)?$')
+
+# עמודות שכבר הודפסה עליהן אזהרה (אחת לכל עמודה, לא לכל שורה)
+_skipped_columns = set()
+
+
+class Progress:
+    """
+    מעקב התקדמות ותפוקה - מודפס ל-stderr
+    """
+
+    def __init__(self, label: str, total: Optional[int] = None, interval: float = 1.0):
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.ok = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self._last_report = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, success: bool):
+        """
+        רישום פריט שהסתיים והדפסת התקדמות אחת ל-interval שניות
+        """
+        with self._lock:
+            if success:
+                self.ok += 1
+            else:
+                self.failed += 1
+            now = time.monotonic()
+            if now - self._last_report >= self.interval:
+                self._last_report = now
+                self._print(end='\r')
+
+    def _print(self, end: str = '\n'):
+        done = self.ok + self.failed
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        of_total = f"/{self.total}" if self.total is not None else ""
+        print(f"[{self.label}] {done}{of_total} ok={self.ok} failed={self.failed} "
+              f"{done / elapsed:.1f}/s", end=end, file=sys.stderr, flush=True)
+
+    def finish(self, manager: JiraIssueManager):
+        """
+        הדפסת סיכום: כמות, זמן, תפוקת פריטים ותפוקת בקשות
+        """
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        done = self.ok + self.failed
+        requests_sent = manager.scheduler.request_count
+        self._print()
+        print(f"[{self.label}] הסתיים: {self.ok} הצליחו, {self.failed} נכשלו, "
+              f"{elapsed:.2f}s, {done / elapsed:.1f} פריטים/s, "
+              f"{requests_sent} בקשות ({requests_sent / elapsed:.1f}/s)",
+              file=sys.stderr)
+
+
+def run_parallel(items: Iterable, worker: Callable[[Any], bool], progress: Progress,
+                 concurrency: int) -> None:
+    """
+    הרצת worker על כל הפריטים במקביל, עם עדכון התקדמות
+
+    Args:
+        items (Iterable): הפריטים לעיבוד
+        worker (Callable): פונקציה שמחזירה True בהצלחה
+        progress (Progress): מעקב ההתקדמות
+        concurrency (int): מספר threads
+    """
+    def run(item):
+        try:
+            success = bool(worker(item))
+        except Exception as e:
+            print(f"שגיאה בעיבוד {item!r}: {str(e)}", file=sys.stderr)
+            success = False
+        progress.update(success)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # צריכה הדרגתית של הקלט כדי לא להחזיק את כל הקובץ בזיכרון
+        pending = set()
+        for item in items:
+            pending.add(executor.submit(run, item))
+            if len(pending) >= concurrency * 4:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+        wait(pending)
+
+
+def read_rows(path: str, fmt: Optional[str] = None) -> Iterable[Dict]:
+    """
+    קריאת שורות מקובץ CSV או JSONL ('-' = stdin)
+
+    Args:
+        path (str): נתיב הקובץ
+        fmt (str): csv או jsonl - ברירת מחדל לפי סיומת הקובץ
+
+    Yields:
+        Dict: שורה אחת
+    """
+    if fmt is None:
+        fmt = 'csv' if path.lower().endswith('.csv') else 'jsonl'
+    stream = sys.stdin if path == '-' else open(path, encoding='utf-8', newline='')
+    try:
+        if fmt == 'csv':
+            yield from csv.DictReader(stream)
+        else:
+            from Jira import get_codec
+            codec = get_codec()
+            for line in stream:
+                line = line.strip()
+                if line:
+                    yield codec.loads(line)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def row_to_issue_args(row: Dict, default_project: Optional[str], csv_cells: bool = False) -> Dict:
+    """
+    המרת שורת קלט לפרמטרים של create_issue
+
+    Args:
+        row (Dict): השורה
+        default_project (str): פרויקט לשורות ללא project
+        csv_cells (bool): האם הערכים הם מחרוזות מ-CSV שיש לפענח (JSON / מספרים)
+    """
+    args = {}
+    custom_fields = {}
+    for column, value in row.items():
+        if value in (None, ''):
+            continue
+        target = IMPORT_COLUMNS.get(column.strip().lower()) if isinstance(column, str) else None
+        if target == 'labels' and isinstance(value, str):
+            value = [label.strip() for label in value.split(',') if label.strip()]
+        if target:
+            args[target] = value
+            continue
+
+        field_id = _field_id(column)
+        if field_id is None:
+            if column not in _skipped_columns:
+                _skipped_columns.add(column)
+                print(f"העמודה '{column}' אינה מזהה שדה (customfield_NNNNN או שדה מערכת) - מדולגת",
+                      file=sys.stderr)
+            continue
+        if csv_cells:
+            value = _cell_value(value)
+            if field_id in NAMED_LIST_FIELDS and isinstance(value, str):
+                # "API, UI" -> [{"name": "API"}, {"name": "UI"}]
+                value = [{"name": name.strip()} for name in value.split(',') if name.strip()]
+        custom_fields[field_id] = value
+    args.setdefault('project_key', default_project)
+    if not args['project_key'] or not args.get('summary'):
+        raise ValueError("חסרים project או summary")
+    if custom_fields:
+        args['custom_fields'] = custom_fields
+    return args
+
+
+def _field_id(column: Any) -> Optional[str]:
+    """
+    מזהה השדה בג'ירה עבור שם עמודה, או None אם העמודה אינה מזהה שדה
+    """
+    if not isinstance(column, str):
+        return None
+    column = column.strip()
+    if _CUSTOM_FIELD.match(column):
+        return column
+    return SYSTEM_FIELDS.get(column.lower())
+
+
+def _cell_value(value: Any) -> Any:
+    """
+    המרת תא CSV לערך השדה: JSON לתא שמתחיל ב-{, [ או ", מספר לתא מספרי
+    """
+    text = value.strip()
+    if text[:1] in ('{', '[', '"'):
+        from Jira import get_codec
+        return get_codec().loads(text)
+    if _NUMBER.match(text):
+        return float(text) if '.' in text else int(text)
+    return value
+
+
+def collect_issue_keys(manager: JiraIssueManager, args) -> Optional[List[str]]:
+    """
+    מפתחות ה-Issues לעבודה מרוכזת - מתוך --jql או מקובץ --keys
+
+    כל המפתחות נאספים לפני שמתחילים לשנות Issues: מעבר סטטוס מוציא Issues
+    מתוצאות ה-JQL, ועימוד תוך כדי שינוי היה מדלג עליהם.
+
+    Returns:
+        Optional[List[str]]: המפתחות, או None אם אחד מעמודי החיפוש נכשל
+    """
+    if args.keys:
+        stream = sys.stdin if args.keys == '-' else open(args.keys, encoding='utf-8')
+        try:
+            return [line.strip() for line in stream if line.strip()]
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+    keys = []
+    while True:
+        page = manager.search_issues_page(args.jql, len(keys), args.page_size, ['status'])
+        if page is None:
+            print(f"שגיאה באיסוף Issues אחרי {len(keys)} תוצאות - לא בוצעו שינויים",
+                  file=sys.stderr)
+            return None
+        issues = page.get('issues', [])
+        keys.extend(issue['key'] for issue in issues)
+        if not issues or len(keys) >= page.get('total', 0):
+            return keys
+
+
+def cmd_import(manager: JiraIssueManager, args) -> int:
+    progress = Progress('import')
+
+    if args.resolve_users:
+        # assignee (אימייל / שם תצוגה / accountId) מתורגם מקומית - טעינה אחת בשימוש הראשון
+        from jira_users import UserDirectory
+        manager.user_directory = UserDirectory(manager, project_key=args.users_project,
+                                               page_size=1000, max_age=0)
+
+    # ערכים מ-JSONL כבר מוקלדים; רק תאי CSV מפוענחים
+    fmt = args.format or ('csv' if args.file.lower().endswith('.csv') else 'jsonl')
+
+    def create(row):
+        return manager.create_issue(**row_to_issue_args(row, args.project, fmt == 'csv')) is not None
+
+    run_parallel(read_rows(args.file, fmt), create, progress, args.concurrency)
+    progress.finish(manager)
+    return 1 if progress.failed else 0
+
+
+def cmd_export(manager: JiraIssueManager, args) -> int:
+    fields = [f.strip() for f in args.fields.split(',')] if args.fields else None
+    first = manager.search_issues_page(args.jql, 0, args.page_size, fields)
+    if first is None:
+        return 1
+
+    total = first.get('total', 0)
+    progress = Progress('export', total)
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+
+    try:
+        if args.format == 'csv':
+            columns = ['key'] + (fields or ['summary', 'status'])
+            writer = csv.writer(out)
+            writer.writerow(columns)
+
+            def write(issue):
+                issue_fields = issue.get('fields', {})
+                row = [issue.get('key')]
+                for column in columns[1:]:
+                    value = issue_fields.get(column)
+                    if isinstance(value, dict):
+                        value = value.get('name', value.get('value', value.get('displayName', value)))
+                    elif isinstance(value, list):
+                        value = ','.join(str(v.get('name', v) if isinstance(v, dict) else v) for v in value)
+                    row.append(value)
+                writer.writerow(row)
+        else:
+            codec = manager.codec
+
+            def write(issue):
+                out.write(codec.dumps(issue).decode('utf-8'))
+                out.write('\n')
+
+        def fetch(start_at):
+            page = manager.search_issues_page(args.jql, start_at, step, fields)
+            return start_at, None if page is None else page.get('issues', [])
+
+        # אחרי העמוד הראשון ידוע ה-total, כך ששאר העמודים נטענים במקביל ונכתבים לפי הסדר.
+        # הצעד הוא גודל העמוד שהשרת החזיר בפועל - ג'ירה עשויה להגביל את maxResults
+        first_issues = first.get('issues', [])
+        step = min(first.get('maxResults') or args.page_size, len(first_issues))
+        starts = range(len(first_issues), total, step) if first_issues else []
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            for start_at, issues in _chain_first((0, first_issues), executor.map(fetch, starts)):
+                if issues is None:
+                    print(f"שגיאה בטעינת העמוד שמתחיל ב-{start_at}", file=sys.stderr)
+                    progress.update(False)
+                    continue
+                for issue in issues:
+                    write(issue)
+                    progress.update(True)
+                if len(issues) < step and start_at + len(issues) < total:
+                    print(f"העמוד שמתחיל ב-{start_at} החזיר {len(issues)} מתוך {step} Issues",
+                          file=sys.stderr)
+                    progress.update(False)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    progress.finish(manager)
+    # כל עמוד שנכשל או חזר חסר נרשם ככישלון - קובץ חלקי לא ייראה כהצלחה
+    return 1 if progress.failed else 0
+
+
+def _chain_first(first, rest: Iterable) -> Iterable:
+    yield first
+    yield from rest
+
+
+def cmd_transition(manager: JiraIssueManager, args) -> int:
+    progress = Progress('transition')
+    target = args.to.lower()
+
+    def transition(key):
+        for option in manager.get_issue_transitions(key):
+            names = (option.get('id'), option.get('name', ''), option.get('to', {}).get('name', ''))
+            if target in (str(name).lower() for name in names):
+                return manager.transition_issue(key, option['id'])
+        print(f"אין מעבר '{args.to}' זמין עבור {key}", file=sys.stderr)
+        return False
+
+    keys = collect_issue_keys(manager, args)
+    if keys is None:
+        return 1
+    progress.total = len(keys)
+    run_parallel(keys, transition, progress, args.concurrency)
+    progress.finish(manager)
+    return 1 if progress.failed else 0
+
+
+def cmd_comment(manager: JiraIssueManager, args) -> int:
+    progress = Progress('comment')
+    text = args.text if args.text is not None else sys.stdin.read()
+    # אותו גוף לכל ה-Issues - נבנה ומקודד ל-JSON פעם אחת בלבד
+    from jira_adf import markdown_to_adf, text_to_adf
+    body = manager.codec.dumps(markdown_to_adf(text) if args.markdown else text_to_adf(text))
+
+    def comment(key):
+        return manager.add_comment(key, body)
+
+    keys = collect_issue_keys(manager, args)
+    if keys is None:
+        return 1
+    progress.total = len(keys)
+    run_parallel(keys, comment, progress, args.concurrency)
+    progress.finish(manager)
+    return 1 if progress.failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Batch operations against Jira")
+    parser.add_argument('--url', default=os.environ.get('JIRA_URL'), help="כתובת ג'ירה (JIRA_URL)")
+    parser.add_argument('--user', default=os.environ.get('JIRA_USER'), help="משתמש/אימייל (JIRA_USER)")
+    parser.add_argument('--token', default=os.environ.get('JIRA_TOKEN'), help="API Token (JIRA_TOKEN)")
+    parser.add_argument('--codec', help="קודק JSON (orjson, msgspec, ujson, json)")
+
+    batch = argparse.ArgumentParser(add_help=False)
+    batch.add_argument('--concurrency', type=int, default=8, help="מספר בקשות במקביל")
+    batch.add_argument('--page-size', type=int, default=100, help="גודל עמוד בחיפוש")
+    batch.add_argument('--rate-limit', type=float, default=0, help="בקשות לשנייה (0 = ללא הגבלה)")
+
+    keys = argparse.ArgumentParser(add_help=False)
+    source = keys.add_mutually_exclusive_group(required=True)
+    source.add_argument('--jql', help="שאילתת JQL לבחירת Issues")
+    source.add_argument('--keys', help="קובץ עם מפתח Issue בכל שורה ('-' = stdin)")
+
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('import', parents=[batch], help="ייבוא Issues מ-CSV/JSONL")
+    p.add_argument('file', help="קובץ הקלט ('-' = stdin)")
+    p.add_argument('--format', choices=['csv', 'jsonl'], help="ברירת מחדל: לפי סיומת")
+    p.add_argument('--project', help="מפתח פרויקט לשורות ללא project")
+    p.add_argument('--no-resolve-users', dest='resolve_users', action='store_false',
+                   help="שליחת assignee כפי שהוא, בלי תרגום ל-accountId")
+    p.add_argument('--users-project', help="טעינת משתמשים שניתן להקצות בפרויקט זה בלבד")
+    p.set_defaults(handler=cmd_import)
+
+    p = commands.add_parser('export', parents=[batch], help="ייצוא תוצאות JQL")
+    p.add_argument('jql', help="שאילתת JQL")
+    p.add_argument('-o', '--output', default='-', help="קובץ הפלט ('-' = stdout)")
+    p.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl')
+    p.add_argument('--fields', help="רשימת שדות מופרדת בפסיקים")
+    p.set_defaults(handler=cmd_export)
+
+    p = commands.add_parser('transition', parents=[batch, keys], help="מעבר סטטוס מרוכז")
+    p.add_argument('--to', required=True, help="שם המעבר, סטטוס היעד או מזהה המעבר")
+    p.set_defaults(handler=cmd_transition)
+
+    p = commands.add_parser('comment', parents=[batch, keys], help="הוספת תגובה מרוכזת")
+    p.add_argument('--text', help="טקסט התגובה (ברירת מחדל: stdin)")
+    p.add_argument('--markdown', action='store_true', help="פענוח הטקסט כמרקדאון")
+    p.set_defaults(handler=cmd_comment)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not (args.url and args.user and args.token):
+        parser.error("חסרים פרטי התחברות: --url/--user/--token או JIRA_URL/JIRA_USER/JIRA_TOKEN")
+    if args.command == 'comment' and args.keys == '-' and args.text is None:
+        # גם המפתחות וגם הטקסט היו נקראים מ-stdin
+        parser.error("comment --keys - דורש --text (stdin כבר משמש לרשימת המפתחות)")
+
+    # כל הבקשות של ה-CLI הן עבודת אצווה, ולכן אין צורך לשמור מקומות לבקשות אינטראקטיביות
+    scheduler = RequestScheduler(
+        max_concurrency=args.concurrency, rate_limit=args.rate_limit,
+        default_priority=BATCH, interactive_reserve=0
+    )
+    manager = JiraIssueManager(args.url, args.user, args.token, codec=args.codec, scheduler=scheduler)
+    return args.handler(manager, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+קודק JSON לגופי בקשות ותגובות של Jira
+
+בוחר אוטומטית את המימוש המהיר ביותר שמותקן (orjson, msgspec, ujson)
+ונופל חזרה ל-json של הספרייה הסטנדרטית. כל הקודקים עובדים ישירות
+על bytes של התגובה (response.content) - בלי פענוח ביניים ל-str.
+"""
+
+from typing import Any, Dict, Optional
+
+
+class JsonCodec:
+    """
+    קודק בסיסי - json של הספרייה הסטנדרטית
+    """
+
+    name = 'json'
+
+    def __init__(self):
+        import json
+        self._json = json
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        המרת אובייקט לגוף בקשה
+
+        Args:
+            obj (Any): האובייקט להמרה
+
+        Returns:
+            bytes: JSON מקודד ב-UTF-8
+        """
+        return self._json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        """
+        פענוח גוף תגובה
+
+        Args:
+            data (bytes): גוף התגובה כפי שהתקבל מהשרת
+
+        Returns:
+            Any: האובייקט המפוענח
+        """
+        return self._json.loads(data)
+
+    def loads_search_page(self, data: bytes) -> Dict:
+        """
+        פענוח עמוד תוצאות של /search
+
+        Args:
+            data (bytes): גוף התגובה
+
+        Returns:
+            Dict: מילון עם issues, total, startAt, maxResults (ו-warningMessages אם יש)
+        """
+        return self.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    קודק מבוסס orjson
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """
+    קודק מבוסס ujson
+    """
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        return self._ujson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """
+    קודק מבוסס msgspec - עמודי חיפוש מפוענחים לפי סכמה, כך ששדות
+    ברמה העליונה שלא נדרשים (names, schema וכו') לא נבנים כלל
+    """
+
+    name = 'msgspec'
+
+    def __init__(self):
+        import msgspec
+
+        class SearchPage(msgspec.Struct):
+            issues: list = []
+            total: int = 0
+            startAt: int = 0
+            maxResults: int = 0
+            warningMessages: list = []
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._page_decoder = msgspec.json.Decoder(SearchPage)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+    def loads_search_page(self, data: bytes) -> Dict:
+        page = self._page_decoder.decode(data)
+        return {
+            'issues': page.issues,
+            'total': page.total,
+            'startAt': page.startAt,
+            'maxResults': page.maxResults,
+            'warningMessages': page.warningMessages
+        }
+
+
+# סדר העדפה לזיהוי אוטומטי
+CODECS = {
+    'orjson': OrjsonCodec,
+    'msgspec': MsgspecCodec,
+    'ujson': UjsonCodec,
+    'json': JsonCodec,
+}
+
+_default_codec: Optional[JsonCodec] = None
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    קבלת קודק JSON
+
+    Args:
+        name (str): שם קודק מסוים (orjson, msgspec, ujson, json) - אם לא סופק,
+            נבחר המהיר ביותר שמותקן
+
+    Returns:
+        JsonCodec: מופע הקודק
+    """
+    global _default_codec
+
+    if name is not None:
+        if name not in CODECS:
+            raise ValueError(f"קודק לא מוכר: {name} (זמינים: {', '.join(CODECS)})")
+        return CODECS[name]()
+
+    if _default_codec is None:
+        for codec_class in CODECS.values():
+            try:
+                _default_codec = codec_class()
+                break
+            except ImportError:
+                continue
+    return _default_codec
@@ -0,0 +1,233 @@
+"""
+מתזמן בקשות לפי עדיפות עבור JiraIssueManager
+
+מופע אחד של JiraIssueManager משרת גם פעולות אינטראקטיביות (get_issue,
+get_field_suggestions) וגם עבודות אצווה (ייצוא search_issues, update_issue
+מרוכז). המתזמן מחלק את מאגר החיבורים ואת תקציב הקצב בין מחלקות העדיפות
+ב-weighted fair queueing, ושומר מקומות פנויים לבקשות אינטראקטיביות כך שהן
+לא ממתינות לבקשות אצווה שכבר רצות.
+
+דוגמה:
+    scheduler = RequestScheduler(max_concurrency=8, rate_limit=50)
+    jira = JiraIssueManager(url, user, token, scheduler=scheduler)
+
+    with jira.priority(BATCH):
+        for issue in jira.iter_issues("project = PROJ"):
+            ...
+
+    # ב-threads ההקשר לא עובר - עותק של המנהל עם עדיפות קבועה
+    batch = jira.with_priority(BATCH)
+    executor.map(lambda key: batch.update_issue(key, fields), keys)
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+INTERACTIVE = 'interactive'
+BATCH = 'batch'
+
+DEFAULT_WEIGHTS = {
+    INTERACTIVE: 16,
+    BATCH: 1,
+}
+
+_current_priority: contextvars.ContextVar = contextvars.ContextVar('jira_priority', default=None)
+
+
+class _Waiter:
+    __slots__ = ('priority', 'start_tag', 'finish_tag', 'enqueued', 'granted')
+
+    def __init__(self, priority: str, start_tag: float, finish_tag: float):
+        self.priority = priority
+        self.start_tag = start_tag
+        self.finish_tag = finish_tag
+        self.enqueued = time.monotonic()
+        self.granted = False
+
+
+class RequestScheduler:
+    """
+    מתזמן WFQ עם מגבלת מקביליות משותפת ו-token bucket משותף לקצב
+    """
+
+    def __init__(self, max_concurrency: int = 8, rate_limit: float = 0,
+                 weights: Optional[Dict[str, float]] = None,
+                 default_priority: str = INTERACTIVE, interactive_reserve: int = 1):
+        """
+        Args:
+            max_concurrency (int): מספר בקשות מקסימלי במקביל (וגודל מאגר החיבורים)
+            rate_limit (float): בקשות לשנייה לכל המחלקות יחד (0 = ללא הגבלה)
+            weights (Dict[str, float]): משקל לכל מחלקת עדיפות
+            default_priority (str): עדיפות לבקשות שלא צוינה להן עדיפות
+            interactive_reserve (int): מקומות שמחלקות שאינן אינטראקטיביות לא יכולות לתפוס
+        """
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        self.default_priority = default_priority
+        self.interactive_reserve = min(interactive_reserve, max_concurrency - 1)
+
+        self._cond = threading.Condition()
+        self._queues: Dict[str, deque] = {name: deque() for name in self.weights}
+        self._last_finish: Dict[str, float] = {name: 0.0 for name in self.weights}
+        self._virtual_time = 0.0
+        self._active = 0
+        self._active_by_class: Dict[str, int] = {name: 0 for name in self.weights}
+
+        self._tokens = float(max(1, int(rate_limit)))
+        self._token_capacity = self._tokens
+        self._tokens_updated = time.monotonic()
+
+        self._stats: Dict[str, Dict[str, float]] = {
+            name: {'requests': 0, 'wait_total': 0.0, 'wait_max': 0.0} for name in self.weights
+        }
+
+    @contextmanager
+    def priority(self, name: str):
+        """
+        קביעת עדיפות לכל הבקשות בבלוק (ב-thread/task הנוכחי)
+
+        העדיפות נשמרת ב-contextvar: asyncio tasks יורשים אותה, אבל threads של
+        ThreadPoolExecutor לא - שם יש להשתמש ב-JiraIssueManager.with_priority
+        או להגיש את ה-worker דרך contextvars.copy_context().run.
+        """
+        self._check_priority(name)
+        token = _current_priority.set(name)
+        try:
+            yield
+        finally:
+            _current_priority.reset(token)
+
+    def current_priority(self) -> str:
+        """
+        העדיפות האפקטיבית בהקשר הנוכחי
+        """
+        return _current_priority.get() or self.default_priority
+
+    @contextmanager
+    def slot(self, priority: Optional[str] = None):
+        """
+        המתנה למקום פנוי לפי התור ההוגן, והחזקתו לאורך הבלוק
+
+        Args:
+            priority (str): מחלקת העדיפות (ברירת מחדל: current_priority())
+        """
+        priority = priority or self.current_priority()
+        self._check_priority(priority)
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    def acquire(self, priority: str):
+        """
+        המתנה למקום פנוי (יש לקרוא ל-release בסיום)
+        """
+        with self._cond:
+            start_tag = max(self._virtual_time, self._last_finish[priority])
+            waiter = _Waiter(priority, start_tag, start_tag + 1.0 / self.weights[priority])
+            self._last_finish[priority] = waiter.finish_tag
+            self._queues[priority].append(waiter)
+
+            self._dispatch()
+            while not waiter.granted:
+                self._cond.wait(self._token_delay())
+                self._dispatch()
+
+            stats = self._stats[priority]
+            waited = time.monotonic() - waiter.enqueued
+            stats['requests'] += 1
+            stats['wait_total'] += waited
+            stats['wait_max'] = max(stats['wait_max'], waited)
+
+    def release(self, priority: str):
+        """
+        שחרור מקום שהתקבל ב-acquire
+        """
+        with self._cond:
+            self._active -= 1
+            self._active_by_class[priority] -= 1
+            self._dispatch()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        סטטיסטיקה לכל מחלקה: מספר בקשות, זמן המתנה ממוצע ומקסימלי (שניות)
+        """
+        with self._cond:
+            return {
+                name: {
+                    'requests': int(values['requests']),
+                    'wait_avg': values['wait_total'] / values['requests'] if values['requests'] else 0.0,
+                    'wait_max': values['wait_max'],
+                }
+                for name, values in self._stats.items()
+            }
+
+    @property
+    def request_count(self) -> int:
+        """
+        סך כל הבקשות שקיבלו מקום
+        """
+        with self._cond:
+            return int(sum(values['requests'] for values in self._stats.values()))
+
+    def _check_priority(self, name: str):
+        if name not in self.weights:
+            raise ValueError(f"עדיפות לא מוכרת: {name} (זמינות: {', '.join(self.weights)})")
+
+    def _limit_for(self, priority: str) -> int:
+        if priority == INTERACTIVE:
+            return self.max_concurrency
+        return self.max_concurrency - self.interactive_reserve
+
+    def _refill_tokens(self):
+        if not self.rate_limit:
+            return
+        now = time.monotonic()
+        self._tokens = min(self._token_capacity,
+                           self._tokens + (now - self._tokens_updated) * self.rate_limit)
+        self._tokens_updated = now
+
+    def _token_delay(self) -> Optional[float]:
+        """
+        זמן עד לאסימון הבא - כדי שממתינים יתעוררו גם בלי release
+        """
+        if not self.rate_limit or self._tokens >= 1:
+            return None
+        return (1 - self._tokens) / self.rate_limit
+
+    def _dispatch(self):
+        """
+        הענקת מקומות לממתינים לפי תג הסיום הקטן ביותר (נקרא כשה-lock מוחזק)
+        """
+        granted = False
+        self._refill_tokens()
+        while self._active < self.max_concurrency:
+            if self.rate_limit and self._tokens < 1:
+                break
+
+            best = None
+            for name, queue in self._queues.items():
+                if queue and self._active_by_class[name] < self._limit_for(name):
+                    if best is None or queue[0].finish_tag < best.finish_tag:
+                        best = queue[0]
+            if best is None:
+                break
+
+            self._queues[best.priority].popleft()
+            self._virtual_time = max(self._virtual_time, best.start_tag)
+            self._active += 1
+            self._active_by_class[best.priority] += 1
+            if self.rate_limit:
+                self._tokens -= 1
+            best.granted = True
+            granted = True
+
+        if granted:
+            self._cond.notify_all()
@@ -0,0 +1,293 @@
+"""
+אינדקס משתמשים מקומי לתרגום assignee ל-accountId
+
+הספרייה עוברת פעם אחת על כל עמודי המשתמשים ובונה אינדקסים בזיכרון לפי
+accountId, אימייל ושם תצוגה (כולל חיפוש לפי תחילית). רענון מחיל רק את
+ההבדלים על האינדקסים, ומשתמש שלא נמצא נשלף בבקשת חיפוש ממוקדת אחת
+ונוסף לאינדקס - כך ש-import של 10k שורות לא שולח בקשה לכל שורה.
+
+דוגמה:
+    jira.user_directory = UserDirectory(jira)
+    jira.create_issue("PROJ", "כותרת", assignee="dana@example.com")   # נשלח כ-accountId
+"""
+
+import bisect
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class UserDirectory:
+    """
+    מטמון משתמשים עם אינדקסים לפי accountId, אימייל ושם תצוגה
+    """
+
+    def __init__(self, manager, project_key: Optional[str] = None, page_size: int = 1000,
+                 max_age: float = 3600.0, fetch_missing: bool = True, retry_after: float = 60.0):
+        """
+        Args:
+            manager (JiraIssueManager): החיבור לג'ירה
+            project_key (str): אם סופק - רק משתמשים שניתן להקצות בפרויקט
+            page_size (int): מספר משתמשים בכל בקשה (עד 1000)
+            max_age (float): שניות עד רענון אוטומטי (0 = ללא רענון אוטומטי)
+            fetch_missing (bool): חיפוש ממוקד בשרת עבור ערך שלא נמצא באינדקס
+            retry_after (float): שניות עד ניסיון טעינה חוזר אחרי טעינה שנכשלה
+        """
+        self.manager = manager
+        self.project_key = project_key
+        self.page_size = page_size
+        self.max_age = max_age
+        self.fetch_missing = fetch_missing
+        self.retry_after = retry_after
+        self.loaded_at: Optional[float] = None
+        self._failed_at: Optional[float] = None
+
+        self._by_id: Dict[str, Dict] = {}
+        self._by_email: Dict[str, str] = {}
+        self._by_name: Dict[str, Set[str]] = {}
+        # (שם תצוגה באותיות קטנות, accountId) ממוין - לחיפוש תחילית עם bisect
+        self._sorted_names: List[Tuple[str, str]] = []
+        # ערכים שכבר חופשו בשרת ולא נמצאו
+        self._missing: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def load(self, force: bool = False) -> 'UserDirectory':
+        """
+        טעינה ראשונה (או רענון אם המטמון ישן מ-max_age)
+
+        אחרי טעינה שנכשלה אין ניסיון נוסף במשך retry_after שניות - כך ש-import
+        של 10k שורות לא עובר שוב על כל עמודי המשתמשים בכל שורה. רענון שנכשל
+        משאיר את האינדקס הקיים בשימוש.
+
+        Args:
+            force (bool): רענון גם אם המטמון עדכני
+
+        Raises:
+            RuntimeError: אם אין אינדקס טעון והטעינה נכשלה (עכשיו או לפני פחות מ-retry_after)
+        """
+        with self._lock:
+            now = time.monotonic()
+            stale = self.max_age and self.loaded_at is not None and \
+                now - self.loaded_at > self.max_age
+            if not (self.loaded_at is None or stale or force):
+                return self
+
+            if not force and self._failed_at is not None and now - self._failed_at < self.retry_after:
+                if self.loaded_at is None:
+                    raise RuntimeError("טעינת המשתמשים נכשלה לאחרונה - האינדקס אינו זמין")
+                return self
+
+            try:
+                self.refresh()
+            except Exception as e:
+                self._failed_at = now
+                if self.loaded_at is None:
+                    raise
+                print(f"שגיאה ברענון משתמשים - ממשיכים עם האינדקס הקיים: {str(e)}")
+            else:
+                self._failed_at = None
+        return self
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        מעבר על כל עמודי המשתמשים והחלת ההבדלים בלבד על האינדקסים
+
+        Returns:
+            Dict[str, int]: מספר המשתמשים שנוספו, עודכנו והוסרו
+        """
+        users = []
+        while True:
+            page = self.manager.get_users_page(self.project_key, len(users), self.page_size)
+            if page is None:
+                # כישלון באמצע לא אמור להיראות כאילו כל המשתמשים נמחקו
+                raise RuntimeError("שגיאה בטעינת משתמשים - האינדקס לא עודכן")
+            if not page:
+                break
+            users.extend(page)
+
+        counts = {'added': 0, 'updated': 0, 'removed': 0}
+        with self._lock:
+            current = {user['accountId']: user for user in users
+                       if user.get('accountId') and _assignable(user)}
+            if not self._by_id:
+                # טעינה ראשונה - בנייה מרוכזת ומיון אחד במקום insort לכל משתמש
+                for user in current.values():
+                    self._add(user, keep_sorted=False)
+                self._sorted_names.sort()
+                counts['added'] = len(current)
+            else:
+                for account_id in list(self._by_id):
+                    if account_id not in current:
+                        self._remove(account_id)
+                        counts['removed'] += 1
+                for account_id, user in current.items():
+                    known = self._by_id.get(account_id)
+                    if known == user:
+                        continue
+                    if known is not None:
+                        self._remove(account_id)
+                        counts['updated'] += 1
+                    else:
+                        counts['added'] += 1
+                    self._add(user)
+            self._missing.clear()
+            self.loaded_at = time.monotonic()
+        return counts
+
+    def users(self) -> List[Dict]:
+        """
+        המשתמשים שבאינדקס כרגע - בלי טעינה או רענון (לשימוש במסלולים אינטראקטיביים)
+        """
+        with self._lock:
+            return list(self._by_id.values())
+
+    def get(self, account_id: str) -> Optional[Dict]:
+        """
+        משתמש לפי accountId
+        """
+        self.load()
+        return self._by_id.get(account_id)
+
+    def by_email(self, email: str) -> Optional[Dict]:
+        """
+        משתמש לפי אימייל (ללא תלות באותיות גדולות/קטנות)
+        """
+        self.load()
+        account_id = self._by_email.get(email.strip().lower())
+        return self._by_id.get(account_id) if account_id else None
+
+    def by_display_name(self, name: str) -> List[Dict]:
+        """
+        כל המשתמשים עם שם התצוגה הזה (שמות תצוגה אינם ייחודיים)
+        """
+        self.load()
+        ids = self._by_name.get(name.strip().lower(), ())
+        return [self._by_id[account_id] for account_id in ids]
+
+    def search_prefix(self, prefix: str, limit: int = 20) -> List[Dict]:
+        """
+        משתמשים ששם התצוגה שלהם מתחיל ב-prefix, ממוינים לפי שם
+
+        Args:
+            prefix (str): תחילית (ללא תלות באותיות גדולות/קטנות)
+            limit (int): מספר התוצאות המקסימלי
+        """
+        self.load()
+        prefix = prefix.strip().lower()
+        with self._lock:
+            results = []
+            index = bisect.bisect_left(self._sorted_names, (prefix, ''))
+            while index < len(self._sorted_names) and len(results) < limit:
+                name, account_id = self._sorted_names[index]
+                if not name.startswith(prefix):
+                    break
+                results.append(self._by_id[account_id])
+                index += 1
+            return results
+
+    def resolve(self, value: str) -> Optional[str]:
+        """
+        תרגום accountId, אימייל או שם תצוגה ל-accountId
+
+        Args:
+            value (str): הערך לתרגום
+
+        Returns:
+            Optional[str]: ה-accountId, או None אם לא נמצא או שהשם אינו חד-משמעי
+        """
+        self.load()
+        value = value.strip()
+        account_id = self._lookup(value)
+        lowered = value.lower()
+        # שם תצוגה מוכר שאינו חד-משמעי לא יוכרע בחיפוש נוסף בשרת
+        if account_id is None and self.fetch_missing and lowered not in self._missing \
+                and lowered not in self._by_name:
+            self._fetch(value)
+            account_id = self._lookup(value)
+        return account_id
+
+    def resolve_many(self, values: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        תרגום של ערכים רבים - כל ערך ייחודי מתורגם פעם אחת
+
+        Returns:
+            Dict[str, Optional[str]]: ערך -> accountId (או None)
+        """
+        return {value: self.resolve(value) for value in set(values) if value}
+
+    def _lookup(self, value: str) -> Optional[str]:
+        with self._lock:
+            if value in self._by_id:
+                return value
+            lowered = value.lower()
+            if '@' in lowered:
+                return self._by_email.get(lowered)
+            ids = self._by_name.get(lowered, ())
+            if len(ids) == 1:
+                return next(iter(ids))
+            if len(ids) > 1:
+                print(f"שם התצוגה '{value}' אינו חד-משמעי ({len(ids)} משתמשים)")
+            return None
+
+    def _fetch(self, value: str):
+        """
+        חיפוש ממוקד בשרת עבור ערך שלא נמצא באינדקס
+
+        ב-Jira Cloud השדה emailAddress מוסתר כברירת מחדל, אבל חיפוש לפי אימייל
+        עדיין מחזיר את המשתמש - לכן התאמה פעילה יחידה לאימייל נשמרת באינדקס.
+        """
+        found = [user for user in self.manager.search_users(value)
+                 if user.get('accountId') and _assignable(user)]
+        lowered = value.lower()
+        with self._lock:
+            for user in found:
+                account_id = user['accountId']
+                if self._by_id.get(account_id) == user:
+                    continue
+                if account_id in self._by_id:
+                    self._remove(account_id)
+                self._add(user)
+            if '@' in lowered and len(found) == 1 and lowered not in self._by_email:
+                self._by_email[lowered] = found[0]['accountId']
+            if self._lookup(value) is None:
+                self._missing.add(lowered)
+
+    def _add(self, user: Dict, keep_sorted: bool = True):
+        account_id = user['accountId']
+        self._by_id[account_id] = user
+        email = (user.get('emailAddress') or '').lower()
+        if email:
+            self._by_email[email] = account_id
+        name = (user.get('displayName') or '').lower()
+        if name:
+            self._by_name.setdefault(name, set()).add(account_id)
+            if keep_sorted:
+                bisect.insort(self._sorted_names, (name, account_id))
+            else:
+                self._sorted_names.append((name, account_id))
+
+    def _remove(self, account_id: str):
+        user = self._by_id.pop(account_id)
+        email = (user.get('emailAddress') or '').lower()
+        if email and self._by_email.get(email) == account_id:
+            del self._by_email[email]
+        name = (user.get('displayName') or '').lower()
+        if name:
+            ids = self._by_name.get(name, set())
+            ids.discard(account_id)
+            if not ids:
+                self._by_name.pop(name, None)
+            index = bisect.bisect_left(self._sorted_names, (name, account_id))
+            if index < len(self._sorted_names) and self._sorted_names[index] == (name, account_id):
+                del self._sorted_names[index]
+
+
+def _assignable(user: Dict) -> bool:
+    """
+    משתמש שאפשר להקצות לו Issue - לא משתמש מושבת ולא חשבון של אפליקציה
+    """
+    return user.get('active', True) is not False and \
+        user.get('accountType', 'atlassian') == 'atlassian'
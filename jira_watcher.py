@@ -0,0 +1,389 @@
+"""
+מעקב שינויים אינקרמנטלי אחרי שאילתות JQL
+
+במקום להוריד את כל תוצאות השאילתה בכל סבב, לכל שאילתה נשמר high-water mark
+(תחילת הסבב המוצלח האחרון), וכל סבב מביא רק Issues שהשדה updated שלהם השתנה מאז. שאילתות עם אותה רשימת
+שדות ממוזגות לבקשת חיפוש אחת (q1) OR (q2) ..., ורק כשיש מועמדים לשינוי
+נבדקת השייכות של כל אחד מהם לכל שאילתה.
+
+דוגמה:
+    watcher = JqlWatcher(jira, interval=60)
+    watcher.watch("project = PROJ AND status = 'To Do'", lambda event: print(event))
+    watcher.start()          # thread ברקע
+    # או: await watcher.run_async()
+"""
+
+import math
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+# אורך מקסימלי לשאילתת JQL ממוזגת (מגבלת השרת על גוף הבקשה גבוהה בהרבה, אבל
+# שאילתות ארוכות מדי מאטות את הפענוח בצד של ג'ירה)
+MAX_JQL_LENGTH = 6000
+
+# מספר מפתחות מקסימלי בתנאי key in (...) אחד
+KEYS_PER_CLAUSE = 200
+
+_ORDER_BY = re.compile(r'\s+ORDER\s+BY\s+.*$', re.IGNORECASE | re.DOTALL)
+
+
+class WatchEvent(NamedTuple):
+    """
+    אירוע שינוי בשאילתה
+
+    kind: 'added' (נכנס לתוצאות), 'changed' (עודכן), 'removed' (יצא מהתוצאות)
+    """
+    kind: str
+    jql: str
+    key: str
+    issue: Optional[Dict]
+
+
+class WatchedQuery:
+    """
+    מצב של שאילתה אחת במעקב
+    """
+
+    def __init__(self, jql: str, callback: Callable[[WatchEvent], Any], fields: Tuple[str, ...]):
+        self.jql = _ORDER_BY.sub('', jql).strip()
+        self.callback = callback
+        self.fields = fields
+        self.members: Dict[str, str] = {}
+        self.high_water_mark: Optional[datetime] = None
+        self.initialized = False
+
+
+def parse_jira_datetime(value: str) -> datetime:
+    """
+    המרת תאריך בפורמט של ג'ירה (2024-01-15T10:23:45.123+0000) ל-datetime
+    """
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f%z')
+
+
+class JqlWatcher:
+    """
+    לולאת polling אחת משותפת לשאילתות JQL רבות
+    """
+
+    def __init__(self, manager, interval: float = 60.0, page_size: int = 100,
+                 overlap_minutes: int = 1, resync_every: int = 0, emit_initial: bool = False):
+        """
+        Args:
+            manager (JiraIssueManager): החיבור לג'ירה
+            interval (float): שניות בין סבבים
+            page_size (int): גודל עמוד בחיפוש
+            overlap_minutes (int): מרווח ביטחון (בדקות) אחורה מה-high-water mark -
+                ל-JQL יש רזולוציה של דקות, וכפילויות מסוננות לפי ערך updated
+            resync_every (int): סנכרון מלא אחת ל-N סבבים (לזיהוי Issues שנמחקו); 0 = לעולם לא
+            emit_initial (bool): האם לשלוח אירועי added על התוצאות הראשונות של שאילתה חדשה
+        """
+        self.manager = manager
+        self.interval = interval
+        self.page_size = page_size
+        self.overlap_minutes = overlap_minutes
+        self.resync_every = resync_every
+        self.emit_initial = emit_initial
+        self.polls = 0
+
+        self._queries: List[WatchedQuery] = []
+        # ערך updated האחרון שנבדק לכל מועמד (לפי קבוצת שדות) - כדי שחפיפת החלון
+        # לא תגרום לבדיקות שייכות חוזרות
+        self._seen: Dict[Tuple[str, ...], Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, jql: str, callback: Callable[[WatchEvent], Any],
+              fields: Iterable[str] = ('summary', 'status')) -> WatchedQuery:
+        """
+        רישום שאילתה למעקב
+
+        Args:
+            jql (str): שאילתת JQL (ORDER BY מוסר)
+            callback (Callable): פונקציה שמקבלת WatchEvent
+            fields (Iterable[str]): השדות שיוחזרו באירועים (updated נוסף תמיד)
+
+        Returns:
+            WatchedQuery: מזהה לביטול המעקב
+        """
+        fields = tuple(sorted(set(fields) | {'updated'}))
+        query = WatchedQuery(jql, callback, fields)
+        with self._lock:
+            self._queries.append(query)
+        return query
+
+    def unwatch(self, query: WatchedQuery):
+        """
+        ביטול מעקב אחרי שאילתה
+        """
+        with self._lock:
+            if query in self._queries:
+                self._queries.remove(query)
+
+    def poll(self) -> List[WatchEvent]:
+        """
+        סבב אחד על כל השאילתות הרשומות - האירועים נשלחים ל-callbacks ומוחזרים
+
+        Returns:
+            List[WatchEvent]: האירועים שנוצרו בסבב
+        """
+        with self._poll_lock:
+            with self._lock:
+                queries = list(self._queries)
+
+            self.polls += 1
+            resync = self.resync_every and self.polls % self.resync_every == 0
+            events = []
+
+            groups: Dict[Tuple[str, ...], List[WatchedQuery]] = {}
+            for query in queries:
+                if not query.initialized or resync:
+                    try:
+                        events.extend(self._full_sync(query))
+                    except Exception as e:
+                        print(f"שגיאה בסנכרון {query.jql}: {str(e)}")
+                else:
+                    groups.setdefault(query.fields, []).append(query)
+
+            for fields, group in groups.items():
+                try:
+                    self._incremental_sync(fields, group, events)
+                except Exception as e:
+                    print(f"שגיאה בסבב אינקרמנטלי: {str(e)}")
+
+            for event, query in events:
+                try:
+                    query.callback(event)
+                except Exception as e:
+                    print(f"שגיאה ב-callback של {query.jql}: {str(e)}")
+
+            return [event for event, _ in events]
+
+    def _full_sync(self, query: WatchedQuery) -> List[Tuple[WatchEvent, WatchedQuery]]:
+        """
+        הורדת כל תוצאות השאילתה והשוואה למצב הידוע
+        """
+        started = datetime.now(timezone.utc)
+        current = {issue['key']: issue for issue in self._fetch_all(query.jql, query.fields)}
+
+        emit = query.initialized or self.emit_initial
+        events = []
+        if emit:
+            events = self._diff(query, current, set(query.members) | set(current))
+        else:
+            query.members = {key: self._updated(issue) for key, issue in current.items()}
+
+        query.high_water_mark = started
+        query.initialized = True
+        return events
+
+    def _incremental_sync(self, fields: Tuple[str, ...], group: List[WatchedQuery],
+                          events: List[Tuple[WatchEvent, WatchedQuery]]):
+        """
+        סבב אינקרמנטלי לקבוצת שאילתות עם אותם שדות - האירועים מתווספים ל-events
+
+        ה-high-water mark של שאילתה מתקדם לתחילת הסבב רק אחרי שבדיקת השייכות
+        שלה הצליחה, כך ששאילתה שקטה לא מרחיבה את החלון של שאר הקבוצה.
+        """
+        started = datetime.now(timezone.utc)
+        since = min(query.high_water_mark for query in group)
+        age = (started - since).total_seconds()
+        minutes = max(1, math.ceil(age / 60)) + self.overlap_minutes
+        updated_clause = f'updated >= "-{minutes}m"'
+
+        # מועמדים: כל מה שהשתנה ותואם לאחת השאילתות, או שהיה חבר באחת מהן
+        # (כדי לזהות Issues שיצאו מהתוצאות)
+        clauses = [f"({query.jql})" for query in group]
+        known_keys = sorted(set().union(*(query.members for query in group)))
+        clauses.extend(_key_clauses(known_keys))
+
+        seen = self._seen.setdefault(fields, {})
+        candidates: Dict[str, Dict] = {}
+        warnings: List[str] = []
+        for jql in _pack_clauses(clauses, f" AND {updated_clause}"):
+            for issue in self._fetch_all(jql, fields, warnings):
+                if seen.get(issue['key']) != self._updated(issue):
+                    candidates[issue['key']] = issue
+
+        if warnings:
+            # מפתח ידוע שנמחק או עבר פרויקט - רק סנכרון מלא מסיר אותו מהחברים,
+            # אחרת הוא היה נשלח שוב בכל סבב
+            for query in group:
+                try:
+                    events.extend(self._full_sync(query))
+                except Exception as e:
+                    print(f"שגיאה בסנכרון {query.jql}: {str(e)}")
+            return
+
+        checked_all = True
+        candidate_keys = sorted(candidates)
+        for query in group:
+            if candidate_keys:
+                try:
+                    matching = set()
+                    for jql in _pack_clauses(_key_clauses(candidate_keys), '',
+                                             prefix=f"({query.jql}) AND "):
+                        matching.update(issue['key'] for issue in self._fetch_all(jql, ('updated',)))
+                except Exception as e:
+                    # ה-high-water mark של השאילתה לא מתקדם, כך שהסבב הבא יכסה את אותו חלון
+                    print(f"שגיאה בבדיקת שייכות עבור {query.jql}: {str(e)}")
+                    checked_all = False
+                    continue
+
+                current = {key: candidates[key] for key in matching}
+                events.extend(self._diff(query, current, candidate_keys))
+
+            query.high_water_mark = started
+
+        if not checked_all:
+            # מועמד נחשב כנבדק רק אחרי שכל השאילתות בקבוצה בדקו אותו
+            return
+
+        for key, issue in candidates.items():
+            seen[key] = self._updated(issue)
+
+        # מועמדים ישנים מתחילת החלון כבר לא יוחזרו שוב
+        self._seen[fields] = {
+            key: updated for key, updated in seen.items()
+            if updated and parse_jira_datetime(updated) >= since
+        }
+
+    def _fetch_all(self, jql: str, fields: Iterable[str],
+                   warnings: Optional[List[str]] = None) -> List[Dict]:
+        """
+        הורדת כל עמודי התוצאות - חריגה אם עמוד נכשל (כדי שכישלון לא ייראה כתוצאה ריקה)
+
+        ה-polling רץ ברקע, ולכן מתוזמן בעדיפות batch.
+
+        Args:
+            jql (str): שאילתת JQL
+            fields (Iterable[str]): השדות להחזרה
+            warnings (List[str]): אם סופקה - החיפוש רץ עם validateQuery=warn, כך שמפתח
+                שכבר לא קיים לא מכשיל את כל השאילתה, והאזהרות מתווספות לרשימה
+        """
+        validate_query = 'warn' if warnings is not None else None
+        issues = []
+        while True:
+            page = self.manager.search_issues_page(jql, len(issues), self.page_size, list(fields),
+                                                   priority='batch', validate_query=validate_query)
+            if page is None:
+                raise RuntimeError(f"החיפוש נכשל: {jql}")
+            if warnings is not None:
+                warnings.extend(page.get('warningMessages') or ())
+            batch = page.get('issues', [])
+            issues.extend(batch)
+            if not batch or len(issues) >= page.get('total', 0):
+                return issues
+
+    def _diff(self, query: WatchedQuery, current: Dict[str, Dict],
+              keys: Iterable[str]) -> List[Tuple[WatchEvent, WatchedQuery]]:
+        """
+        השוואת התוצאות הנוכחיות (עבור keys) למצב הידוע ועדכון המצב
+        """
+        events = []
+        for key in keys:
+            issue = current.get(key)
+            known = query.members.get(key)
+            if issue is None:
+                if key in query.members:
+                    del query.members[key]
+                    events.append((WatchEvent('removed', query.jql, key, None), query))
+                continue
+            updated = self._updated(issue)
+            if key not in query.members:
+                events.append((WatchEvent('added', query.jql, key, issue), query))
+            elif updated != known:
+                events.append((WatchEvent('changed', query.jql, key, issue), query))
+            query.members[key] = updated
+        return events
+
+    @staticmethod
+    def _updated(issue: Dict) -> str:
+        return issue.get('fields', {}).get('updated', '')
+
+    def start(self) -> threading.Thread:
+        """
+        הפעלת לולאת ה-polling ב-thread ברקע
+        """
+        if self._thread and self._thread.is_alive():
+            return self._thread
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='jira-jql-watcher', daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        עצירת הלולאה (thread או asyncio)
+        """
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"שגיאה בסבב polling: {str(e)}")
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    async def run_async(self):
+        """
+        לולאת polling כ-asyncio task - הבקשות עצמן רצות ב-thread נפרד
+
+        דוגמה:
+            task = asyncio.create_task(watcher.run_async())
+        """
+        import asyncio
+
+        self._stop.clear()
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                await asyncio.to_thread(self.poll)
+            except Exception as e:
+                print(f"שגיאה בסבב polling: {str(e)}")
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+
+def _key_clauses(keys: List[str]) -> List[str]:
+    """
+    פיצול רשימת מפתחות לתנאי key in (...) בגודל מוגבל
+    """
+    return [
+        f"key in ({', '.join(keys[i:i + KEYS_PER_CLAUSE])})"
+        for i in range(0, len(keys), KEYS_PER_CLAUSE)
+    ]
+
+
+def _pack_clauses(clauses: List[str], suffix: str, prefix: str = '') -> List[str]:
+    """
+    איחוד תנאים ב-OR לכמה שפחות שאילתות, כל אחת עד MAX_JQL_LENGTH תווים
+
+    Args:
+        clauses (List[str]): התנאים לאיחוד
+        suffix (str): סיומת לכל שאילתה (למשל " AND updated >= ...")
+        prefix (str): תחילית לכל שאילתה
+
+    Returns:
+        List[str]: שאילתות JQL
+    """
+    queries = []
+    batch: List[str] = []
+    length = 0
+    for clause in clauses:
+        if batch and length + len(clause) + 4 > MAX_JQL_LENGTH:
+            queries.append(f"{prefix}({' OR '.join(batch)}){suffix}")
+            batch, length = [], 0
+        batch.append(clause)
+        length += len(clause) + 4
+    if batch:
+        queries.append(f"{prefix}({' OR '.join(batch)}){suffix}")
+    return queries